@@ -45,6 +45,8 @@ class ExtractError(Exception):
 
 class BaseStacCommit(ReadableStacIO, metaclass=ABCMeta):
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, repository: "BaseStacRepository"):
         raise NotImplementedError
@@ -101,8 +103,9 @@ class BaseStacCommit(ReadableStacIO, metaclass=ABCMeta):
         try:
             os.makedirs(export_dir, exist_ok=True)
 
-            if os.listdir(export_dir):
-                raise FileExistsError(f"{export_dir} is not empty.")
+            with os.scandir(export_dir) as entries:
+                if next(entries, None) is not None:
+                    raise FileExistsError(f"{export_dir} is not empty.")
         except Exception as error:
             raise ExtractError(f"Couldn't create the extraction directory. {str(error)}") from error
 
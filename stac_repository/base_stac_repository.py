@@ -8,12 +8,19 @@ from typing import (
     List,
     Dict,
     Union,
+    Tuple,
     Any,
 )
 
 import sys
 import os
 import shutil
+from functools import singledispatchmethod
+from queue import Queue
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    Future
+)
 
 
 from abc import (
@@ -93,23 +100,32 @@ class ProcessingError(Exception):
 
 class ErrorGroup(Exception):
 
+    _errors: Dict[str, BaseException]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._errors = {}
 
     def __setitem__(self, key, item):
-        self.__dict__[key] = item
+        self._errors[key] = item
 
     def __getitem__(self, key):
-        return self.__dict__[key]
+        return self._errors[key]
 
     def __delitem__(self, key):
-        del self.__dict__[key]
+        del self._errors[key]
 
     def __len__(self):
-        return len(self.__dict__)
+        return len(self._errors)
+
+    def __iter__(self):
+        return iter(self._errors)
+
+    def __contains__(self, key):
+        return key in self._errors
 
     def items(self):
-        return self.__dict__.items()
+        return self._errors.items()
 
 
 class SkipIteration(Exception):
@@ -143,6 +159,7 @@ class BaseStacRepository(metaclass=ABCMeta):
         while (commit := commit.parent) is not None:
             yield commit
 
+    @singledispatchmethod
     def get_commit(self, ref: Union[str, datetime.datetime, int]) -> BaseStacCommit:
         """Get a commit matching some ref. Either the commit id, its index from the most recent commit, or the most recent commit before some date.
 
@@ -150,33 +167,113 @@ class BaseStacRepository(metaclass=ABCMeta):
             CommitNotFoundError: If no, or multiple, commits matching the ref are found.
             RefTypeError: Invalid ref type
         """
-        if isinstance(ref, str):
-            candidates: List[BaseStacCommit] = []
-
-            for commit in self.commits:
-                if commit.id.startswith(ref):
-                    candidates.append(commit)
-
-            if not candidates:
-                raise CommitNotFoundError
-            elif len(candidates) > 1:
-                raise CommitNotFoundError(f"Multiple commits found matching ref {ref}")
-            else:
-                return candidates.pop()
-        elif isinstance(ref, int):
-            for (i, commit) in enumerate(self.commits):
-                if -i == ref:
-                    return commit
+        raise RefTypeError("Bad ref")
 
-            raise CommitNotFoundError
-        elif isinstance(ref, datetime.datetime):
-            for commit in self.commits:
-                if commit.datetime <= ref:
-                    return commit
+    @get_commit.register(str)
+    def _get_commit_by_id(self, ref: str) -> BaseStacCommit:
+        candidates: List[BaseStacCommit] = []
+
+        for commit in self.commits:
+            if commit.id.startswith(ref):
+                candidates.append(commit)
 
+        if not candidates:
             raise CommitNotFoundError
+        elif len(candidates) > 1:
+            raise CommitNotFoundError(f"Multiple commits found matching ref {ref}")
         else:
-            raise RefTypeError("Bad ref")
+            return candidates.pop()
+
+    @get_commit.register(int)
+    def _get_commit_by_index(self, ref: int) -> BaseStacCommit:
+        for (i, commit) in enumerate(self.commits):
+            if -i == ref:
+                return commit
+
+        raise CommitNotFoundError
+
+    @get_commit.register(datetime.datetime)
+    def _get_commit_by_datetime(self, ref: datetime.datetime) -> BaseStacCommit:
+        for commit in self.commits:
+            if commit.datetime <= ref:
+                return commit
+
+        raise CommitNotFoundError
+
+    def _ingest_product(
+        self,
+        product_source: str,
+        identification: Future[Tuple[str, str]],
+        *,
+        processor_id: str,
+        processor: Processor,
+        parent_id: Optional[str],
+        ingest_assets: bool,
+        ingest_assets_out_of_scope: bool,
+        ingest_out_of_scope: bool,
+    ) -> Iterator[JobReport]:
+        """Ingests a single discovered product, in its own transaction. `identification` resolves to the product
+        (id, version).
+
+        Raises:
+            ProcessingError: Processor raised an error
+            FileNotFoundError: Product source does not exist
+            StacObjectError: Product source is not a valid STAC object
+            HrefError:  Product source href (scheme) cannot be processed
+            UncatalogError:
+            CatalogError:
+        """
+        reporter = JobReportBuilder(product_source)
+
+        with self.StacTransaction(self).context(
+            message=f"Ingest {product_source} (processor={processor_id}:{processor.__version__})"
+        ) as transaction:
+
+            yield reporter.progress("Identifying & versionning")
+
+            try:
+                try:
+                    (product_id, product_version) = identification.result()
+                except Exception as error:
+                    raise ProcessingError(str(error)) from error
+
+                yield reporter.progress(f"Identified {product_id} (version={product_version})")
+
+                cataloged_stac_object = transaction.search(product_id)
+
+                if cataloged_stac_object is not None:
+                    try:
+                        if product_version == _get_version(cataloged_stac_object):
+                            raise SkipIteration
+                    except (_VersionNotFoundError, StacObjectError) as error:
+                        yield reporter.progress(f"{product_id} found but unversionned, reprocessing")
+                    else:
+                        yield reporter.progress(f"Previous version of {product_id} found, reprocessing")
+                else:
+                    yield reporter.progress(f"{product_id} not found, processing")
+
+                try:
+                    processed_stac_object_file = processor.process(product_source)
+                except Exception as error:
+                    raise ProcessingError(str(error)) from error
+
+                yield reporter.progress(f"Cataloging {product_id} (version={product_version})")
+
+                transaction.catalog(
+                    processed_stac_object_file,
+                    parent_id=parent_id,
+                    catalog_assets=ingest_assets,
+                    catalog_assets_out_of_scope=ingest_assets_out_of_scope,
+                    catalog_out_of_scope=ingest_out_of_scope,
+                    version=product_version
+                )
+
+                yield reporter.complete(f"Cataloged {product_id} (version={product_version})")
+            except SkipIteration:
+                yield reporter.complete(f"{product_id} (version={product_version}) is already cataloged with matching version, skipping")
+            except Exception as error:
+                yield reporter.fail(error)
+                raise error
 
     def ingest(
         self,
@@ -206,87 +303,64 @@ class BaseStacRepository(metaclass=ABCMeta):
         if processor is None:
             raise ProcessorNotFoundError(processor_id)
 
-        product_sources = []
+        def identify(product_source: str) -> Tuple[str, str]:
+            return (processor.id(product_source), processor.version(product_source))
 
         errors = ErrorGroup()
 
-        for source in sources:
-            reporter = JobReportBuilder(source)
-            yield reporter.progress(f"Discovering products from {source}")
+        with ThreadPoolExecutor() as executor:
 
-            try:
-                discovered_product_sources = list(processor.discover(source))
-                product_sources.extend(discovered_product_sources)
-            except Exception as error:
+            def discover(source: str, discovered: Queue[Optional[Tuple[str, Future[Tuple[str, str]]]]]):
                 try:
-                    raise ProcessingError(str(error)) from error
-                except ProcessingError as error:
-                    yield reporter.fail(error)
-                    errors[f"source={source}"] = error
-            else:
-                if discovered_product_sources:
-                    yield reporter.complete(f"Discovered products {' '.join(discovered_product_sources)}")
-                else:
-                    yield reporter.complete(f"No products discovered")
+                    for product_source in processor.discover(source):
+                        discovered.put((product_source, executor.submit(identify, product_source)))
+                finally:
+                    discovered.put(None)
 
-        for product_source in product_sources:
-            reporter = JobReportBuilder(product_source)
+            discoveries: List[Tuple[str, Queue[Optional[Tuple[str, Future[Tuple[str, str]]]]], Future[None]]] = []
 
-            try:
-                with self.StacTransaction(self).context(
-                    message=f"Ingest {product_source} (processor={processor_id}:{processor.__version__})"
-                ) as transaction:
+            for source in sources:
+                discovered: Queue[Optional[Tuple[str, Future[Tuple[str, str]]]]] = Queue()
+                discoveries.append((source, discovered, executor.submit(discover, source, discovered)))
+
+                yield JobReportBuilder(source).progress(f"Discovering products from {source}")
 
-                    yield reporter.progress("Identifying & versionning")
+            for (source, discovered, discovery) in discoveries:
+                reporter = JobReportBuilder(source)
+
+                product_sources: List[str] = []
+
+                while (discovered_product := discovered.get()) is not None:
+                    (product_source, identification) = discovered_product
+                    product_sources.append(product_source)
 
                     try:
-                        try:
-                            product_id = processor.id(product_source)
-                            product_version = processor.version(product_source)
-                        except Exception as error:
-                            raise ProcessingError(str(error)) from error
-
-                        yield reporter.progress(f"Identified {product_id} (version={product_version})")
-
-                        head = next(self.commits)
-                        cataloged_stac_object = head.search(product_id)
-
-                        if cataloged_stac_object is not None:
-                            try:
-                                if product_version == _get_version(cataloged_stac_object):
-                                    raise SkipIteration
-                            except (_VersionNotFoundError, StacObjectError) as error:
-                                yield reporter.progress(f"{product_id} found but unversionned, reprocessing")
-                            else:
-                                yield reporter.progress(f"Previous version of {product_id} found, reprocessing")
-                        else:
-                            yield reporter.progress(f"{product_id} not found, processing")
-
-                        try:
-                            processed_stac_object_file = processor.process(product_source)
-                        except Exception as error:
-                            raise ProcessingError(str(error)) from error
-
-                        yield reporter.progress(f"Cataloging {product_id} (version={product_version})")
-
-                        transaction.catalog(
-                            processed_stac_object_file,
+                        yield from self._ingest_product(
+                            product_source,
+                            identification,
+                            processor_id=processor_id,
+                            processor=processor,
                             parent_id=parent_id,
-                            catalog_assets=ingest_assets,
-                            catalog_assets_out_of_scope=ingest_assets_out_of_scope,
-                            catalog_out_of_scope=ingest_out_of_scope,
-                            version=product_version
+                            ingest_assets=ingest_assets,
+                            ingest_assets_out_of_scope=ingest_assets_out_of_scope,
+                            ingest_out_of_scope=ingest_out_of_scope,
                         )
-
-                        yield reporter.complete(f"Cataloged {product_id} (version={product_version})")
-                    except SkipIteration:
-                        yield reporter.complete(f"{product_id} (version={product_version}) is already cataloged with matching version, skipping")
                     except Exception as error:
-                        yield reporter.fail(error)
-                        raise error
+                        errors[f"product={product_source}"] = error
 
-            except Exception as error:
-                errors[f"product={product_source}"] = error
+                try:
+                    discovery.result()
+                except Exception as error:
+                    try:
+                        raise ProcessingError(str(error)) from error
+                    except ProcessingError as error:
+                        yield reporter.fail(error)
+                        errors[f"source={source}"] = error
+                else:
+                    if product_sources:
+                        yield reporter.complete(f"Discovered products {' '.join(product_sources)}")
+                    else:
+                        yield reporter.complete(f"No products discovered")
 
         if errors:
             raise errors
@@ -311,8 +385,9 @@ class BaseStacRepository(metaclass=ABCMeta):
             try:
                 os.makedirs(extract, exist_ok=True)
 
-                if os.listdir(extract):
-                    raise FileExistsError(f"{extract} is not empty.")
+                with os.scandir(extract) as entries:
+                    if next(entries, None) is not None:
+                        raise FileExistsError(f"{extract} is not empty.")
             except Exception as error:
                 raise ExtractError(f"Couldn't create the extraction directory. {str(error)}") from error
 
@@ -93,6 +93,71 @@ class BaseStacTransaction(StacIO, metaclass=ABCMeta):
         """Commits the transaction in progress (i.e. confirms all changes made to the catalog up to this point)"""
         raise NotImplementedError
 
+    def search(
+        self,
+        id: str,
+    ) -> Optional[Union[Item, Collection, Catalog]]:
+        """Searches the cataloged object `id`, as it is in the transaction in progress.
+
+        This method will **not** lookup objects outside of the repository.
+        """
+        try:
+            self.get("/catalog.json")
+        except FileNotFoundError:
+            return None
+
+        return search(
+            "/catalog.json",
+            id=id,
+            io=self,
+        )
+
+    def _update_ancestors(
+        self,
+        parent: Union[Item, Collection, Catalog]
+    ) -> Union[Item, Collection, Catalog]:
+        """Recomputes the extents of `parent` ancestor collections after one of its children changed.
+
+        The walk stops at the first collection whose extent is left unchanged, as the extents above it
+        cannot change either.
+
+        Returns the topmost modified ancestor : saving it saves `parent` and all the modified ancestors in between,
+        ancestors above it are left untouched.
+        """
+        modified_ancestor: Union[Item, Collection, Catalog] = parent
+
+        last_ancestor: Union[Item, Collection, Catalog] = parent
+        while True:
+            if isinstance(last_ancestor, Collection):
+                try:
+                    extent = compute_extent(last_ancestor, io=self)
+                except StacObjectError as error:
+                    logger.exception(
+                        f"[{type(error).__name__}] Skipped recomputing ancestor extents : {str(error)}")
+                    break
+
+                if extent == last_ancestor.extent:
+                    break
+
+                last_ancestor.extent = extent
+                modified_ancestor = last_ancestor
+
+            try:
+                ancestor = load_parent(
+                    last_ancestor,
+                    io=self,
+                )
+            except (HrefError) as error:
+                logger.exception(f"[{type(error).__name__}] Skipped recomputing ancestor extents : {str(error)}")
+                break
+
+            if ancestor is None:
+                break
+            else:
+                last_ancestor = ancestor
+
+        return modified_ancestor
+
     def catalog(
         self,
         product_file: str,
@@ -122,7 +187,7 @@ class BaseStacTransaction(StacIO, metaclass=ABCMeta):
             product_base = product_base_url.geturl()
 
         scope_perm = StacIOPerm.R_STAC | (
-            StacIOPerm.R_STAC if catalog_assets else StacIOPerm.NONE
+            StacIOPerm.R_ASSETS if catalog_assets else StacIOPerm.NONE
         )
 
         out_of_scope_perm = StacIOPerm.NONE | (
@@ -172,11 +237,7 @@ class BaseStacTransaction(StacIO, metaclass=ABCMeta):
             except FileNotFoundError:
                 pass
 
-            parent = search(
-                "/catalog.json",
-                id=parent_id,
-                io=self,
-            )
+            parent = self.search(parent_id)
 
             if parent is None:
                 raise CatalogError(f"Parent {parent_id} not found in catalog")
@@ -186,33 +247,9 @@ class BaseStacTransaction(StacIO, metaclass=ABCMeta):
 
             set_parent(product, parent)
 
-            last_ancestor: Union[Item, Collection, Catalog] = parent
-            while True:
-                if isinstance(last_ancestor, Collection):
-                    try:
-                        last_ancestor.extent = compute_extent(last_ancestor, io=self)
-                    except StacObjectError as error:
-                        logger.exception(
-                            f"[{type(error).__name__}] Skipped recomputing ancestor extents : {str(error)}")
-                        break
-
-                try:
-                    ancestor = load_parent(
-                        last_ancestor,
-                        io=self,
-                    )
-                except (HrefError) as error:
-                    logger.exception(f"[{type(error).__name__}] Skipped recomputing ancestor extents : {str(error)}")
-                    break
-
-                if ancestor is None:
-                    break
-                else:
-                    last_ancestor = ancestor
-
             try:
                 save(
-                    last_ancestor,
+                    self._update_ancestors(parent),
                     io=self
                 )
             except HrefError as error:
@@ -236,11 +273,7 @@ class BaseStacTransaction(StacIO, metaclass=ABCMeta):
 
         extract_file: Optional[str] = None
 
-        product = search(
-            "/catalog.json",
-            product_id,
-            io=self,
-        )
+        product = self.search(product_id)
 
         if product is None:
             raise FileNotFoundError(f"Product {product_id} not found in catalog")
@@ -251,8 +284,9 @@ class BaseStacTransaction(StacIO, metaclass=ABCMeta):
             try:
                 os.makedirs(extract, exist_ok=True)
 
-                if os.listdir(extract):
-                    raise FileExistsError(f"{extract} is not empty.")
+                with os.scandir(extract) as entries:
+                    if next(entries, None) is not None:
+                        raise FileExistsError(f"{extract} is not empty.")
             except Exception as error:
                 raise ExtractError(f"Couldn't create the extraction directory. {str(error)}") from error
 
@@ -300,34 +334,9 @@ class BaseStacTransaction(StacIO, metaclass=ABCMeta):
                 unset_parent(product)
                 delete(product, io=self)
 
-                last_ancestor: Union[Item, Collection, Catalog] = parent
-                while True:
-                    if isinstance(last_ancestor, Collection):
-                        try:
-                            last_ancestor.extent = compute_extent(last_ancestor, io=self)
-                        except StacObjectError as error:
-                            logger.exception(
-                                f"[{type(error).__name__}] Skipped recomputing ancestor extents : {str(error)}")
-                            break
-
-                    try:
-                        ancestor = load_parent(
-                            last_ancestor,
-                            io=self,
-                        )
-                    except (HrefError) as error:
-                        logger.exception(
-                            f"[{type(error).__name__}] Skipped recomputing ancestor extents : {str(error)}")
-                        break
-
-                    if ancestor is None:
-                        break
-                    else:
-                        last_ancestor = ancestor
-
                 try:
                     save(
-                        last_ancestor,
+                        self._update_ancestors(parent),
                         io=self
                     )
                 except HrefError as error:
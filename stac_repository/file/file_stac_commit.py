@@ -8,9 +8,11 @@ from typing import (
 from contextlib import contextmanager
 
 import os
-import posixpath
+import sys
+import mmap
 import datetime
 import shutil
+import subprocess
 from urllib.parse import urlparse as _urlparse
 
 import orjson
@@ -22,7 +24,8 @@ from stac_repository.base_stac_commit import (
 
 from stac_repository.stac.stac_io import (
     HrefError,
-    JSONObjectError
+    JSONObjectError,
+    href_scheme
 )
 
 if TYPE_CHECKING:
@@ -37,45 +40,52 @@ class FileStacCommit(BaseStacCommit):
         self._base_path = repository._base_path
 
     def _href_to_file(self, href: str):
-        if not _urlparse(href, scheme="").scheme == "":
+        if not href_scheme(href) == "":
             raise HrefError(f"{href} is not in repository directory {self._base_path}")
 
-        file = os.path.normpath(posixpath.abspath(self._base_path) + href)
+        file = os.path.normpath(self._base_path + href)
 
         if not file.startswith(self._base_path):
             raise HrefError(f"{href} is outside of repository {self._base_path}")
 
         return file
 
+    @staticmethod
+    def _load_file(file: str) -> Any:
+        """Parses a JSON object file. Large files are parsed straight from a read-only memory map rather than
+        copied into memory first.
+        """
+        with open(file, "r+b") as object_stream:
+            try:
+                if os.fstat(object_stream.fileno()).st_size < 1024 * 1024:
+                    return orjson.loads(object_stream.read())
+
+                with mmap.mmap(object_stream.fileno(), 0, access=mmap.ACCESS_READ) as object_map:
+                    with memoryview(object_map) as object_view:
+                        return orjson.loads(object_view)
+            except orjson.JSONDecodeError as error:
+                raise JSONObjectError from error
+
     def get(self, href: str):
         file = self._href_to_file(href)
 
         try:
-            with open(f"{file}.bck", "r+b") as object_stream:
-                try:
-                    return orjson.loads(object_stream.read())
-                except orjson.JSONDecodeError as error:
-                    raise JSONObjectError from error
+            return self._load_file(f"{file}.bck")
         except FileNotFoundError:
             pass
 
-        with open(file, "r+b") as object_stream:
-            try:
-                return orjson.loads(object_stream.read())
-            except orjson.JSONDecodeError as error:
-                raise JSONObjectError from error
+        return self._load_file(file)
 
     @contextmanager
     def get_asset(self, href: str):
         file = self._href_to_file(href)
 
         try:
-            with open(f"{file}.bck", "r+b") as asset_stream:
-                yield asset_stream
+            asset_stream = open(f"{file}.bck", "r+b")
         except FileNotFoundError:
-            pass
+            asset_stream = open(file, "r+b")
 
-        with open(file, "r+b") as asset_stream:
+        with asset_stream:
             yield asset_stream
 
     @property
@@ -101,5 +111,16 @@ class FileStacCommit(BaseStacCommit):
         if _urlparse(backup_url).scheme != "":
             raise BackupValueError("Non-filesystem backups are not supported")
 
-        # Replace with rsync
-        shutil.copytree(self._base_path, backup_url, dirs_exist_ok=True)
+        os.makedirs(backup_url, exist_ok=True)
+
+        # Let rsync skip the files already backed up, or let cp share the file blocks on reflink-capable filesystems,
+        # only copying through Python when neither is available
+        if shutil.which("rsync") is not None:
+            command = ["rsync", "-aH", f"{self._base_path}/", f"{backup_url}/"]
+        elif sys.platform == "linux" and shutil.which("cp") is not None:
+            command = ["cp", "-a", "--reflink=auto", f"{self._base_path}/.", f"{backup_url}/"]
+        else:
+            command = None
+
+        if command is None or subprocess.run(command, capture_output=True).returncode != 0:
+            shutil.copytree(self._base_path, backup_url, dirs_exist_ok=True)
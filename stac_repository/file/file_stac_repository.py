@@ -34,5 +34,5 @@ class FileStacRepository(BaseStacRepository):
     ):
         self._base_path = os.path.abspath(config.path)
 
-        if not os.path.isdir(os.path.abspath(config.path)):
-            os.makedirs(os.path.abspath(config.path), exist_ok=True)
+        if not os.path.isdir(self._base_path):
+            os.makedirs(self._base_path, exist_ok=True)
@@ -1,145 +1,256 @@
+from __future__ import annotations
+
 from typing import (
     Any,
     Optional,
     Union,
+    List,
+    Tuple,
+    Callable,
+    Dict,
+    Set,
     BinaryIO,
     TYPE_CHECKING
 )
 
-from contextlib import contextmanager
+from contextlib import contextmanager, AbstractContextManager
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 
 import os
-import posixpath
-import glob
+import stat
+import shutil
 import orjson
-from urllib.parse import urlparse as _urlparse
+from urllib.parse import urljoin
 
 from stac_repository.base_stac_transaction import (
     BaseStacTransaction,
     JSONObjectError,
+    Item,
+    Collection,
+    Catalog,
+    search,
 )
 
 from stac_repository.stac.stac_io import (
-    HrefError
+    HrefError,
+    href_scheme
 )
 
 if TYPE_CHECKING:
     from .file_stac_repository import FileStacRepository
 
 
+class FileStacIndex:
+    """The hrefs of the cataloged objects by id."""
+
+    __slots__ = ("_hrefs", "_ids")
+
+    _hrefs: Dict[str, Set[str]]
+    _ids: Dict[str, str]
+
+    def __init__(self):
+        self._hrefs = {}
+        self._ids = {}
+
+    def get(self, id: str) -> Set[str]:
+        return self._hrefs.get(id, set())
+
+    def add(self, href: str, id: str):
+        self.remove(href)
+
+        self._ids[href] = id
+        self._hrefs.setdefault(id, set()).add(href)
+
+    def remove(self, href: str):
+        id = self._ids.pop(href, None)
+
+        if id is not None:
+            hrefs = self._hrefs[id]
+            hrefs.discard(href)
+
+            if not hrefs:
+                del self._hrefs[id]
+
+    def __contains__(self, href: str) -> bool:
+        return href in self._ids
+
+
 class FileStacTransaction(BaseStacTransaction):
 
+    _repository: "FileStacRepository"
     _base_path: str
+    _lock_file: str
+    _objects: Dict[str, bytes]
+    """Serialized STAC objects set during the transaction, written to their files on commit."""
+    _assets: Set[str]
+    """Files of the assets set during the transaction, staged as `.tmp` files until commit."""
+    _object_files: "OrderedDict[str, bytes]"
+    """Committed STAC object files read during the transaction, the most recently read ones are kept in memory."""
+    _index: Optional[FileStacIndex]
+    """Cataloged objects index, built by the first search of the transaction and kept up to date by its writes."""
+    _is_index_complete: bool
+    """Whether the index still holds every cataloged object, i.e. nothing was written since it was built."""
 
     def __init__(self, repository: "FileStacRepository"):
+        self._repository = repository
         self._base_path = repository._base_path
+        self._lock_file = os.path.join(self._base_path, ".lock")
+        self._objects = {}
+        self._assets = set()
+        self._object_files = OrderedDict()
+        self._index = None
+        self._is_index_complete = False
         self._lock()
 
-    def _rename_suffixed_files(self, suffix: str):
-        for file in glob.iglob(os.path.join(self._base_path, "**", f"*.{suffix}"), recursive=True):
-            os.rename(file, file[:-len(f".{suffix}")])
+    def _settle_suffixed_files(self, kept_suffix: str, discarded_suffix: str):
+        """Renames the files suffixed with `kept_suffix` to their final name, removes the files suffixed with
+        `discarded_suffix` and the directories left empty, all in a single post-order scan of the repository.
+        """
+        kept_suffix = f".{kept_suffix}"
+        discarded_suffix = f".{discarded_suffix}"
 
-    def _remove_suffixed_files(self, suffix: str):
-        for file in glob.iglob(os.path.join(self._base_path, "**", f"*.{suffix}"), recursive=True):
-            os.remove(file)
+        def settle(dir: str) -> bool:
+            is_empty = True
 
-    def _remove_empty_directories(self):
-        removed = set()
+            with os.scandir(dir) as entries:
+                dir_entries = list(entries)
 
-        for (current_dir, subdirs, files) in os.walk(self._base_path, topdown=False):
+            for entry in dir_entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if settle(entry.path):
+                        os.rmdir(entry.path)
+                    else:
+                        is_empty = False
+                elif entry.name.endswith(kept_suffix):
+                    os.rename(entry.path, entry.path[:-len(kept_suffix)])
+                    is_empty = False
+                elif entry.name.endswith(discarded_suffix):
+                    os.remove(entry.path)
+                else:
+                    is_empty = False
 
-            flag = False
-            for subdir in subdirs:
-                if os.path.join(current_dir, subdir) not in removed:
-                    flag = True
-                    break
+            return is_empty
 
-            if not any(files) and not flag:
-                os.rmdir(current_dir)
-                removed.add(current_dir)
+        settle(self._base_path)
 
-    def _lock(self):
-        lock_file = os.path.join(self._base_path, ".lock")
+    def _write_objects(self):
+        for dir in set(os.path.dirname(file) for file in self._objects.keys()):
+            os.makedirs(dir, exist_ok=True)
+
+        def write_object(object: Tuple[str, bytes]):
+            (file, value) = object
+
+            # Serialized objects are written at once, bypassing the buffered file layer
+            object_fd = os.open(f"{file}.tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+            try:
+                with memoryview(value) as object_view:
+                    written = 0
+                    while written < len(object_view):
+                        written += os.write(object_fd, object_view[written:])
+            finally:
+                os.close(object_fd)
+
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(write_object, self._objects.items()))
+
+        self._objects.clear()
 
+    def _lock(self):
         try:
-            with open(lock_file, "r"):
-                raise FileExistsError("Cannot lock the repository, another transaction is already taking place.")
-        except FileNotFoundError:
-            with open(lock_file, "w"):
-                os.utime(lock_file, None)
+            lock_fd = os.open(self._lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_CLOEXEC", 0), 0o644)
+        except FileExistsError as error:
+            raise FileExistsError(
+                "Cannot lock the repository, another transaction is already taking place."
+            ) from error
 
-    def _unlock(self):
-        lock_file = os.path.join(self._base_path, ".lock")
+        os.close(lock_fd)
 
+    def _unlock(self):
         try:
-            os.remove(lock_file)
+            os.remove(self._lock_file)
         except FileNotFoundError as error:
             raise FileNotFoundError("Cannot unlock the repository.") from error
 
     def abort(self):
-        self._rename_suffixed_files("bck")
-        self._remove_suffixed_files("tmp")
-        self._remove_empty_directories()
+        self._index = None
+        self._objects.clear()
+        self._assets.clear()
+        self._settle_suffixed_files("bck", "tmp")
         self._unlock()
 
     def commit(self, *, message: Optional[str] = None):
-        self._rename_suffixed_files("tmp")
-        self._remove_suffixed_files("bck")
-        self._remove_empty_directories()
+        self._write_objects()
+        self._assets.clear()
+        self._settle_suffixed_files("tmp", "bck")
         self._unlock()
 
     def _href_to_file(self, href: str):
-        if not _urlparse(href, scheme="").scheme == "":
+        if not href_scheme(href) == "":
             raise HrefError(f"{href} is not in repository directory {self._base_path}")
 
-        file = os.path.normpath(posixpath.abspath(self._base_path) + href)
+        file = os.path.normpath(self._base_path + href)
 
         if not file.startswith(self._base_path):
             raise HrefError(f"{href} is outside of repository {self._base_path}")
 
         return file
 
-    def get(self, href: str):
-        file = self._href_to_file(href)
-
+    def _read_object_file(self, file: str) -> bytes:
         try:
-            with open(f"{file}.tmp", "r+b") as object_stream:
-                try:
-                    return orjson.loads(object_stream.read())
-                except orjson.JSONDecodeError as error:
-                    raise JSONObjectError from error
-        except FileNotFoundError:
+            self._object_files.move_to_end(file)
+            return self._object_files[file]
+        except KeyError:
             pass
 
         with open(file, "r+b") as object_stream:
-            try:
-                return orjson.loads(object_stream.read())
-            except orjson.JSONDecodeError as error:
-                raise JSONObjectError from error
+            object_bytes = object_stream.read()
 
-    @contextmanager
-    def get_asset(self, href: str):
+        self._object_files[file] = object_bytes
+
+        if len(self._object_files) > 1024:
+            self._object_files.popitem(last=False)
+
+        return object_bytes
+
+    def get(self, href: str):
         file = self._href_to_file(href)
 
+        # Objects set during the transaction are buffered until commit, there is no staged (.tmp) object file
+        # to look for : read either the buffer or the committed file
+        object_bytes = self._objects.get(file)
+
+        if object_bytes is None:
+            object_bytes = self._read_object_file(file)
+
         try:
-            with open(f"{file}.tmp", "r+b") as asset_stream:
-                yield asset_stream
-        except FileNotFoundError:
-            pass
+            return orjson.loads(object_bytes)
+        except orjson.JSONDecodeError as error:
+            raise JSONObjectError from error
 
-        with open(file, "r+b") as asset_stream:
+    @contextmanager
+    def get_asset(self, href: str):
+        file = self._href_to_file(href)
+
+        with open(f"{file}.tmp" if file in self._assets else file, "r+b") as asset_stream:
             yield asset_stream
 
     def set(self, href: str, value: Any):
         file = self._href_to_file(href)
 
-        os.makedirs(os.path.dirname(file), exist_ok=True)
+        try:
+            self._objects[file] = orjson.dumps(value)
+        except orjson.JSONEncodeError as error:
+            raise JSONObjectError from error
 
-        with open(f"{file}.tmp", "w+b") as object_stream:
-            try:
-                object_stream.write(orjson.dumps(value))
-            except orjson.JSONEncodeError as error:
-                raise JSONObjectError from error
+        if self._index is not None:
+            self._is_index_complete = False
+
+            if isinstance(value, dict) and isinstance(value.get("id"), str):
+                self._index.add(href, value["id"])
+            else:
+                self._index.remove(href)
 
     def set_asset(self, href: str, value: BinaryIO):
         file = self._href_to_file(href)
@@ -147,18 +258,160 @@ class FileStacTransaction(BaseStacTransaction):
         os.makedirs(os.path.dirname(file), exist_ok=True)
 
         with open(f"{file}.tmp", "w+b") as asset_stream:
-            while (chunk := value.read()):
-                asset_stream.write(chunk)
+            self._copy_asset(value, asset_stream)
+
+        self._assets.add(file)
+
+    @staticmethod
+    def _copy_asset(value: BinaryIO, asset_stream: BinaryIO):
+        """Copies an asset within the kernel (`os.copy_file_range`, or `os.sendfile`) when the source is a seekable
+        regular file, through 1 MiB chunks otherwise (e.g. HTTP response bodies, whose descriptor is a socket).
+
+        Copied file pages are then dropped from the page cache, which is better kept for the STAC object files.
+        """
+        try:
+            value_fd = value.fileno()
+            is_regular_file = value.seekable() and stat.S_ISREG(os.fstat(value_fd).st_mode)
+        except (AttributeError, OSError):
+            is_regular_file = False
+
+        if not is_regular_file:
+            shutil.copyfileobj(value, asset_stream, 1024 * 1024)
+            return
+
+        offset = value.tell()
+
+        asset_fd = asset_stream.fileno()
+
+        FileStacTransaction._advise(value_fd, "POSIX_FADV_SEQUENTIAL")
+
+        try:
+            if hasattr(os, "copy_file_range"):
+                while (copied := os.copy_file_range(value_fd, asset_fd, 64 * 1024 * 1024, offset)) > 0:
+                    offset += copied
+            else:
+                while (copied := os.sendfile(asset_fd, value_fd, offset, 64 * 1024 * 1024)) > 0:
+                    offset += copied
+        except OSError:
+            value.seek(offset)
+            shutil.copyfileobj(value, asset_stream, 1024 * 1024)
+
+        FileStacTransaction._advise(value_fd, "POSIX_FADV_DONTNEED")
+        FileStacTransaction._advise(asset_fd, "POSIX_FADV_DONTNEED")
+
+    @staticmethod
+    def _advise(fd: int, advice: str):
+        """Hints the kernel about the use of a whole regular file, where `os.posix_fadvise` is available. Only called
+        once `_copy_asset` checked that the descriptor is one (not e.g. the socket of an HTTP response body)."""
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+    def set_assets(
+        self,
+        assets: List[Tuple[str, Callable[[], AbstractContextManager[BinaryIO]]]]
+    ) -> List[Optional[Exception]]:
+        if len(set(href for (href, value) in assets)) < len(assets):
+            return super().set_assets(assets)
+
+        def set_asset(asset: Tuple[str, Callable[[], AbstractContextManager[BinaryIO]]]) -> Optional[Exception]:
+            (href, value) = asset
+
+            try:
+                with value() as asset_stream:
+                    self.set_asset(href, asset_stream)
+            except (HrefError, FileNotFoundError) as error:
+                return error
+            else:
+                return None
+
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(set_asset, assets))
 
     def unset(self, href: str):
         file = self._href_to_file(href)
 
+        self._objects.pop(file, None)
+        self._object_files.pop(file, None)
+
+        if self._index is not None:
+            self._is_index_complete = False
+            self._index.remove(href)
+
+        if file in self._assets:
+            self._assets.discard(file)
+            os.remove(f"{file}.tmp")
+
         try:
             os.rename(file, f"{file}.bck")
         except FileNotFoundError:
             pass
 
-        try:
-            os.rename(f"{file}.tmp", f"{file}.bck")
-        except FileNotFoundError:
-            pass
+    def _index_catalog(self) -> FileStacIndex:
+        """Walks the catalog - reading the objects as plain JSON objects - to index them by id."""
+        index = FileStacIndex()
+
+        hrefs = ["/catalog.json"]
+        visited_hrefs: Set[str] = set()
+
+        while hrefs:
+            href = hrefs.pop()
+
+            if href in visited_hrefs:
+                continue
+
+            visited_hrefs.add(href)
+
+            try:
+                json_object = self.get(href)
+
+                if isinstance(json_object.get("id"), str):
+                    index.add(href, json_object["id"])
+
+                if json_object["type"] != "Feature":
+                    hrefs.extend(
+                        urljoin(href, link["href"])
+                        for link in json_object.get("links", [])
+                        if link.get("rel") in ("item", "child")
+                    )
+            except (FileNotFoundError, JSONObjectError, HrefError, KeyError, AttributeError, TypeError):
+                continue
+
+        return index
+
+    def search(
+        self,
+        id: str,
+    ) -> Optional[Union[Item, Collection, Catalog]]:
+        """Searches the cataloged object `id`, as it is in the transaction in progress.
+
+        Objects are looked up in the transaction index, built on the first search - the repository is locked from
+        then on - and kept up to date by the writes which follow. The catalog is walked again if the indexed href
+        turns out to be stale, or if the object is not indexed and objects were written since the index was built.
+        """
+        if self._index is None:
+            self._index = self._index_catalog()
+            self._is_index_complete = True
+
+        hrefs = self._index.get(id)
+
+        if not hrefs:
+            return None if self._is_index_complete else super().search(id)
+
+        if len(hrefs) == 1:
+            (href,) = hrefs
+
+            stac_object = search(
+                href,
+                id=id,
+                io=self,
+            )
+
+            if stac_object is not None:
+                return stac_object
+
+        return super().search(id)
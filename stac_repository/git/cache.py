@@ -1,21 +1,25 @@
 import abc
+import weakref
 
 
 class Cache(type):
+    """Interns the instances of a class by their constructor arguments, for as long as they are in use."""
+
     kwargs_mark = object()
 
     def __init__(cls, *args, **kwargs):
-        cls._instances = {}
+        cls._instances = weakref.WeakValueDictionary()
 
     def __call__(cls, *args, **kwargs):
         key = args + (Cache.kwargs_mark,) + tuple(sorted(kwargs.items()))
 
-        try:
-            return cls._instances[key]
-        except KeyError:
+        instance = cls._instances.get(key)
+
+        if instance is None:
             instance = super().__call__(*args, **kwargs)
             cls._instances[key] = instance
-            return instance
+
+        return instance
 
 
 class CacheMeta(abc.ABCMeta, Cache):
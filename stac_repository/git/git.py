@@ -5,12 +5,12 @@ from typing import (
     Literal,
     BinaryIO,
     Union,
+    NamedTuple,
     cast
 )
 import os
 import io
 import subprocess
-from typing import NamedTuple
 import datetime
 import re
 from functools import cached_property
@@ -20,18 +20,18 @@ import logging
 import abc
 import contextlib
 import tempfile
-import sys
-
-if sys.version_info >= (3, 9):
-    from functools import cache
-else:
-    from functools import lru_cache
-
-    def cache(user_function, /):
-        return lru_cache(maxsize=None)(user_function)
 
 from ..__about__ import __version__, __name_public__
 from .cache import CacheMeta
+from .git2 import (
+    RefNotFoundError,
+    Signature,
+    GitError as _CatFileError,
+    _CatFileBatch,
+    _decode,
+    _parse_commit_object,
+    _pathspec_git
+)
 
 _logger = logging.getLogger(f"{__name_public__}:git")
 
@@ -66,41 +66,22 @@ class UnsupportedCloneRemoteError(ValueError):
     pass
 
 
-class RefNotFoundError(ValueError):
-    pass
-
-
-class SignatureError(ValueError):
-    pass
-
-
-class Signature(NamedTuple):
-
-    @staticmethod
-    @cache
-    def make(signature_str: str) -> Signature:
-        result = re.fullmatch("(.*)<(.*)>$", signature_str)
-
-        if result is None:
-            raise SignatureError(
-                f"Invalid git signature string {signature_str}")
-
-        name = result.group(1).strip()
-        email = result.group(2).strip()
-
-        return Signature(name=name, email=email)
-
-    name: str
-    email: str = ""
-
-    def __str__(self) -> str:
-        return f"{self.name} <{self.email}>"
+class _CommitHeader(NamedTuple):
+    committer: Signature
+    author: Signature
+    datetime: datetime.datetime
+    message: str
+    parent_id: Optional[str]
 
 
 class Commit(metaclass=CacheMeta):
 
+    __slots__ = ("_id", "_repository", "_parsed_header", "_modified_files", "__weakref__")
+
     _id: str
     _repository: BaseRepository
+    _parsed_header: _CommitHeader
+    _modified_files: list[str]
 
     def __init__(self, repository: BaseRepository, id: str):
         self._repository = repository
@@ -115,75 +96,60 @@ class Commit(metaclass=CacheMeta):
 
     @property
     def refs(self) -> list[str]:
-        result = self._repository._git("show-ref")
-
-        return list(
-            map(
-                lambda line: line[(len(self._id) + 1):],
-                filter(
-                    lambda line: line.startswith(self._id),
-                    result.stdout.splitlines()
-                )
-            )
-        )
+        return list(self._repository._refs_by_id.get(self._id, []))
 
-    @cached_property
-    def committer(self) -> Signature:
-        result = self._repository._git(
-            "show",
-            "-s",
-            r"--format=%cn <%ce>",
-            self._id
-        )
+    @property
+    def _header(self) -> _CommitHeader:
+        """The commit metadata, read and parsed once from the commit object."""
+        try:
+            return self._parsed_header
+        except AttributeError:
+            pass
 
-        return Signature.make(result.stdout.strip())
+        commit_object = self._repository._cat_file.read(self._id)
 
-    @cached_property
-    def author(self) -> Signature:
-        result = self._repository._git(
-            "show",
-            "-s",
-            r"--format=%an <%ae>",
-            self._id
-        )
+        if commit_object is None or commit_object[1] != "commit":
+            raise GitError(f"fatal: bad object {self._id}", code=128)
 
-        return Signature.make(result.stdout.strip())
+        (headers, message) = _parse_commit_object(commit_object[2])
 
-    @cached_property
-    def datetime(self) -> datetime.datetime:
-        result = self._repository._git(
-            "show",
-            "-s",
-            r"--format=%ct",
-            self._id
-        )
+        (committer, committer_timestamp, _) = headers["committer"].rsplit(" ", 2)
+        (author, _, _) = headers["author"].rsplit(" ", 2)
 
-        return datetime.datetime.fromtimestamp(
-            float(result.stdout.strip()),
-            datetime.timezone.utc
+        self._parsed_header = _CommitHeader(
+            committer=Signature.make(committer),
+            author=Signature.make(author),
+            datetime=datetime.datetime.fromtimestamp(
+                float(committer_timestamp),
+                datetime.timezone.utc
+            ),
+            message=message.strip(),
+            parent_id=headers.get("parent")
         )
 
-    @cached_property
-    def message(self) -> str:
-        result = self._repository._git(
-            "show",
-            "-s",
-            r"--format=%B",
-            self._id
-        )
+        return self._parsed_header
 
-        return result.stdout.strip()
+    @property
+    def committer(self) -> Signature:
+        return self._header.committer
 
-    @cached_property
-    def parent(self) -> Optional[Commit]:
-        result = self._repository._git(
-            "rev-list",
-            self._id
-        )
+    @property
+    def author(self) -> Signature:
+        return self._header.author
 
-        parent_ids = result.stdout.strip().splitlines()[1:]
+    @property
+    def datetime(self) -> datetime.datetime:
+        return self._header.datetime
+
+    @property
+    def message(self) -> str:
+        return self._header.message
+
+    @property
+    def parent(self) -> Optional[Commit]:
+        parent_id = self._header.parent_id
 
-        return Commit(self._repository, parent_ids[0]) if parent_ids else None
+        return Commit(self._repository, parent_id) if parent_id is not None else None
 
     def tag(self, tag: str, message: Optional[str] = None):
         self._repository._git(
@@ -195,6 +161,8 @@ class Commit(metaclass=CacheMeta):
             self.id
         )
 
+        self._repository._forget_refs()
+
     def smudge(self, file: str) -> BinaryIO:
         if self._repository.is_lfs_installed:
             pointer = self.read(file)
@@ -221,16 +189,30 @@ class Commit(metaclass=CacheMeta):
     def read(self, file: str, text: bool = True) -> Union[str, bytes]:
         file_rel = os.path.relpath(file, self._repository.dir)
 
-        result = self._repository._git(
-            "show",
-            f"{self._id}:{file_rel}",
-            text=text
-        )
+        try:
+            file_object = self._repository._cat_file.read(f"{self._id}:{file_rel}")
+        except ValueError:
+            result = self._repository._git(
+                "show",
+                f"{self._id}:{file_rel}",
+                text=text
+            )
 
-        return result.stdout
+            return result.stdout
+
+        if file_object is None:
+            raise GitError(f"fatal: path '{file_rel}' does not exist in '{self._id}'", code=128)
+
+        (_, _, content) = file_object
+
+        return _decode(content) if text else content
 
-    @cache
     def list_modified(self) -> list[str]:
+        try:
+            return self._modified_files
+        except AttributeError:
+            pass
+
         result = self._repository._git(
             "show",
             "--format=",
@@ -238,15 +220,21 @@ class Commit(metaclass=CacheMeta):
             self._id
         )
 
-        return [os.path.join(self._repository.dir, file_name) for file_name in result.stdout.strip().splitlines()]
+        self._modified_files = [
+            os.path.join(self._repository.dir, file_name) for file_name in result.stdout.strip().splitlines()
+        ]
 
-    @cached_property
+        return self._modified_files
+
+    @property
     def modified_files(self) -> list[str]:
         return self.list_modified()
 
 
 class BaseRepository():
     _dir: str
+    _cat_file: _CatFileBatch
+    _cat_file_check: _CatFileBatch
 
     @property
     def is_lfs_installed(self) -> bool:
@@ -259,6 +247,16 @@ class BaseRepository():
 
     def __init__(self, dir: str) -> None:
         self._dir = os.path.abspath(dir)
+        self._cat_file = _CatFileBatch(self._dir)
+        self._cat_file_check = _CatFileBatch(self._dir, check=True)
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Stops the git processes kept running to read the repository objects."""
+        self._cat_file.close()
+        self._cat_file_check.close()
 
     @property
     def dir(self):
@@ -310,27 +308,56 @@ class BaseRepository():
         )
 
         if result.returncode != 0:
-            if text:
-                _logger.debug("\n" + result.stderr)
-            raise GitError(result.stderr, code=result.returncode)
+            stderr = result.stderr if text else result.stderr.decode(errors="replace")
+            _logger.debug("\n" + stderr)
+            raise GitError(stderr, code=result.returncode)
 
         if text:
             _logger.debug("\n" + result.stdout)
 
         return result
 
+    @cached_property
+    def _ref_list(self) -> list[tuple[str, str]]:
+        """The (object id, ref name) of all the repository refs, listed once until they are modified."""
+        result = self._git(
+            "for-each-ref",
+            r"--format=%(objectname) %(refname)"
+        )
+
+        return [
+            (object_id, ref)
+            for (object_id, _, ref) in (line.partition(" ") for line in result.stdout.splitlines())
+        ]
+
+    @cached_property
+    def _refs_by_id(self) -> dict[str, list[str]]:
+        refs_by_id: dict[str, list[str]] = {}
+
+        for (object_id, ref) in self._ref_list:
+            refs_by_id.setdefault(object_id, []).append(ref)
+
+        return refs_by_id
+
+    def _forget_refs(self):
+        """Drops the listed refs, after an operation which (may) modify them."""
+        self.__dict__.pop("_ref_list", None)
+        self.__dict__.pop("_refs_by_id", None)
+
     @property
     def refs(self) -> list[str]:
-        result = self._git("show-ref")
-
-        return list(
-            map(
-                lambda line: line.split(" ")[1],
-                result.stdout.splitlines()
-            )
-        )
+        return [ref for (_, ref) in self._ref_list]
 
     def get_commit(self, ref: str) -> Optional[Commit]:
+        try:
+            ref_object = self._cat_file_check.read(ref)
+        except ValueError:
+            pass
+        except _CatFileError:
+            return None
+        else:
+            return Commit(self, ref_object[0]) if ref_object is not None else None
+
         try:
             result = self._git(
                 "rev-parse",
@@ -378,7 +405,10 @@ class RemoteRepository():
 
             repository.push()
 
-    def clone(self, dir: str = tempfile.mkdtemp()):
+    def clone(self, dir: Optional[str] = None):
+        if dir is None:
+            dir = tempfile.mkdtemp()
+
         repository = Repository(dir)
         repository.clone(dir, fetch_lfs_files=False)
 
@@ -507,9 +537,10 @@ class Repository(BaseRepository):
                 )
 
     def add(self, *added_files: str):
-        self._git(
+        _pathspec_git(
+            self._git,
             "add",
-            *[os.path.relpath(modified_file, self.dir) for modified_file in added_files]
+            *(os.path.relpath(file, self.dir) for file in added_files)
         )
 
     def stage_lfs(self):
@@ -549,9 +580,10 @@ class Repository(BaseRepository):
                         raise error
 
     def remove(self, *removed_files: str):
-        self._git(
+        _pathspec_git(
+            self._git,
             "rm",
-            *[os.path.relpath(modified_file, self.dir) for modified_file in removed_files]
+            *(os.path.relpath(file, self.dir) for file in removed_files)
         )
 
     def stage_all(self):
@@ -582,6 +614,8 @@ class Repository(BaseRepository):
             }
         )
 
+        self._forget_refs()
+
         return cast(Commit, self.head)
 
     def clone(self, origin_url: str, fetch_lfs_files: bool = True):
@@ -607,6 +641,8 @@ class Repository(BaseRepository):
         else:
             raise UnsupportedCloneRemoteError(origin_url)
 
+        self._forget_refs()
+
         if self.is_lfs_installed:
             self._git("lfs", "install")
 
@@ -622,6 +658,8 @@ class Repository(BaseRepository):
             "pull"
         )
 
+        self._forget_refs()
+
         if self.is_lfs_installed and fetch_lfs_files:
             self._git(
                 "lfs",
@@ -634,6 +672,8 @@ class Repository(BaseRepository):
             "push"
         )
 
+        self._forget_refs()
+
     def reset(self, ref: str = "HEAD", clean_modified_files: bool = False):
         commit = self[ref]
         if commit is None:
@@ -645,6 +685,8 @@ class Repository(BaseRepository):
             commit.id
         )
 
+        self._forget_refs()
+
         if clean_modified_files:
             self.clean()
 
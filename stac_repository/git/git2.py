@@ -6,7 +6,12 @@ from typing import (
     BinaryIO,
     Union,
     cast,
-    Dict
+    Dict,
+    Tuple,
+    List,
+    Callable,
+    Any,
+    Iterator
 )
 import os
 import io
@@ -14,7 +19,7 @@ import subprocess
 from typing import NamedTuple
 import datetime
 import re
-from functools import cached_property
+from functools import cached_property, partial
 import urllib
 import urllib.parse
 import logging
@@ -23,6 +28,9 @@ import contextlib
 import tempfile
 import sys
 import shutil
+import threading
+import locale
+import atexit
 
 if sys.version_info >= (3, 9):
     from functools import cache
@@ -38,6 +46,10 @@ from .cache import CacheMeta
 _logger = logging.getLogger(f"{__name_public__}:git")
 
 
+PATHSPEC_ARGS_MAX = 64
+"""Beyond this number of files, file names are passed to git through stdin rather than on the command line."""
+
+
 class GitError(Exception):
 
     @staticmethod
@@ -73,16 +85,13 @@ class Signature(NamedTuple):
     @staticmethod
     @cache
     def make(signature_str: str) -> Signature:
-        result = re.fullmatch("(.*)<(.*)>$", signature_str)
+        (name, separator, email) = signature_str.rpartition("<")
 
-        if result is None:
+        if not separator or not email.endswith(">") or "\n" in signature_str:
             raise SignatureError(
                 f"Invalid git signature string {signature_str}")
 
-        name = result.group(1).strip()
-        email = result.group(2).strip()
-
-        return Signature(name=name, email=email)
+        return Signature(name=name.strip(), email=email[:-1].strip())
 
     name: str
     email: str = ""
@@ -91,6 +100,24 @@ class Signature(NamedTuple):
         return f"{self.name} <{self.email}>"
 
 
+def _pathspec_git(run_git: Callable[..., Any], command: str, *file_names: str):
+    """Runs a git command over some files with `run_git`. File names are passed on the command line when they are
+    few, through stdin otherwise (which is not limited in size)."""
+    if len(file_names) <= PATHSPEC_ARGS_MAX:
+        run_git(
+            command,
+            "--",
+            *file_names
+        )
+    else:
+        run_git(
+            command,
+            "--pathspec-from-file=-",
+            "--pathspec-file-nul",
+            input="\0".join(file_names)
+        )
+
+
 @overload
 def git(
     *args: str,
@@ -134,9 +161,9 @@ def git(
     )
 
     if result.returncode != 0:
-        if text:
-            _logger.debug("\n" + result.stderr)
-        raise GitError.make(result.stderr, code=result.returncode)
+        stderr = result.stderr if text else result.stderr.decode(errors="replace")
+        _logger.debug("\n" + stderr)
+        raise GitError.make(stderr, code=result.returncode)
 
     if text:
         _logger.debug("\n" + result.stdout)
@@ -144,46 +171,303 @@ def git(
     return result.stdout
 
 
+class _BlobReader(io.RawIOBase):
+    """Reads a blob of known size out of a `git cat-file --batch` output stream."""
+
+    _stream: BinaryIO
+    _remaining: int
+
+    def __init__(self, stream: BinaryIO, size: int):
+        self._stream = stream
+        self._remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+
+        with memoryview(buffer) as view:
+            read = self._stream.readinto(view[:self._remaining])
+
+        self._remaining -= read or 0
+
+        return read or 0
+
+
+@contextlib.contextmanager
+def open_blob(object_name: str, *, cwd: Optional[str] = None) -> Iterator[BinaryIO]:
+    """Streams a blob (e.g. `<commit>:<path>` or `:<path>`), without reading it all in memory.
+
+    Raises:
+        FileNotFoundError:
+    """
+    _logger.debug(f"git cat-file --batch {object_name}")
+
+    process = subprocess.Popen(
+        [
+            "git",
+            "cat-file",
+            "--batch"
+        ],
+        cwd=cwd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+
+    stdin = cast(BinaryIO, process.stdin)
+    stdout = cast(BinaryIO, process.stdout)
+
+    try:
+        try:
+            stdin.write(object_name.encode("utf-8") + b"\n")
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+        header = stdout.readline()
+
+        if not header.endswith(b"\n") or header.endswith((b" missing\n", b" ambiguous\n")):
+            raise FileNotFoundError(f"path '{object_name}' does not exist")
+
+        (_, _, object_size) = header.split()
+
+        with io.BufferedReader(_BlobReader(stdout, int(object_size)), 1024 * 1024) as blob_stream:
+            yield cast(BinaryIO, blob_stream)
+    finally:
+        if process.poll() is None:
+            process.kill()
+
+        process.wait()
+        stdout.close()
+
+
+class _CatFileBatch():
+    """A long-running `git cat-file --batch` (or `--batch-check`) process, reading any number of objects from a
+    repository without spawning a new git process for each of them.
+    """
+
+    _dir: str
+    _check: bool
+    _process: Optional[subprocess.Popen[bytes]]
+    _lock: threading.Lock
+
+    def __init__(self, dir: str, check: bool = False) -> None:
+        self._dir = dir
+        self._check = check
+        self._process = None
+        self._lock = threading.Lock()
+
+    def read(self, object_name: str) -> Optional[tuple[str, str, bytes]]:
+        """Reads an object (e.g. `HEAD`, `<commit>` or `<commit>:<path>`). Returns its id, its type and its content
+        (left empty by `--batch-check`), or None if it does not exist.
+
+        Raises:
+            ValueError: The object name cannot be written on a single line
+            GitError: The git process exited (e.g. this is not a repository)
+        """
+        if "\n" in object_name:
+            raise ValueError(f"Object name {object_name!r} cannot be read in batch")
+
+        batch_option = "--batch-check" if self._check else "--batch"
+
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                _logger.debug(f"git cat-file {batch_option}")
+
+                self._process = subprocess.Popen(
+                    [
+                        "git",
+                        "cat-file",
+                        batch_option
+                    ],
+                    cwd=self._dir,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+
+            stdin = cast(BinaryIO, self._process.stdin)
+            stdout = cast(BinaryIO, self._process.stdout)
+
+            try:
+                stdin.write(object_name.encode("utf-8") + b"\n")
+                stdin.flush()
+            except BrokenPipeError:
+                header = b""
+            else:
+                header = stdout.readline()
+
+            if not header:
+                code = self._process.wait()
+                self._process = None
+                raise GitError(f"git cat-file {batch_option} exited", code=code or 1)
+
+            if header.endswith((b" missing\n", b" ambiguous\n")):
+                return None
+
+            (object_id, object_type, object_size) = header.split()
+
+            content = b"" if self._check else stdout.read(int(object_size) + 1)[:-1]
+
+            return (object_id.decode("ascii"), object_type.decode("ascii"), content)
+
+    def close(self):
+        with self._lock:
+            if self._process is not None:
+                cast(BinaryIO, self._process.stdin).close()
+                self._process.wait()
+                cast(BinaryIO, self._process.stdout).close()
+                self._process = None
+
+
+def _decode(content: bytes) -> str:
+    """Decodes git output the same way `subprocess.run(..., text=True)` does."""
+    return content.decode(locale.getpreferredencoding(False)).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _parse_commit_object(content: bytes) -> tuple[dict[str, str], str]:
+    """Splits a raw commit object into its headers (first occurence of each) and its message."""
+    (headers_content, _, message_content) = content.partition(b"\n\n")
+
+    headers: dict[str, str] = {}
+
+    for header_line in _decode(headers_content).splitlines():
+        if header_line.startswith(" "):
+            continue
+
+        (key, _, value) = header_line.partition(" ")
+        headers.setdefault(key, value)
+
+    return (headers, _decode(message_content))
+
+
+class _CatFilePool():
+    """The long-running `git cat-file --batch` (or `--batch-check`) processes of a repository, one for each concurrent
+    read. Processes are started when all the others are busy, and reused by the following reads.
+    """
+
+    _dir: str
+    _check: bool
+    _idle: List[_CatFileBatch]
+    _closed: bool
+    _lock: threading.Lock
+
+    def __init__(self, dir: str, check: bool = False) -> None:
+        self._dir = dir
+        self._check = check
+        self._idle = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def read(self, object_name: str) -> Optional[tuple[str, str, bytes]]:
+        """Reads an object, see `_CatFileBatch.read`."""
+        with self._lock:
+            cat_file = self._idle.pop() if self._idle else _CatFileBatch(self._dir, check=self._check)
+
+        try:
+            return cat_file.read(object_name)
+        finally:
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(cat_file)
+                    cat_file = None
+
+            if cat_file is not None:
+                cat_file.close()
+
+    def close(self):
+        with self._lock:
+            (idle, self._idle) = (self._idle, [])
+            self._closed = True
+
+        for cat_file in idle:
+            cat_file.close()
+
+
+_cat_files: Dict[Tuple[str, bool], _CatFilePool] = {}
+_cat_files_lock = threading.Lock()
+
+
+def _cat_file(repository_dir: str, check: bool = False) -> _CatFilePool:
+    """The long-running `git cat-file --batch` (or `--batch-check`) processes of a repository, started on first use
+    and shared by all its commits."""
+    with _cat_files_lock:
+        try:
+            return _cat_files[(repository_dir, check)]
+        except KeyError:
+            cat_files = _cat_files[(repository_dir, check)] = _CatFilePool(repository_dir, check=check)
+            return cat_files
+
+
+def _close_cat_files(repository_dir: str):
+    """Stops the `git cat-file` processes of a repository."""
+    with _cat_files_lock:
+        pools = [_cat_files.pop((repository_dir, check), None) for check in (False, True)]
+
+    for pool in pools:
+        if pool is not None:
+            pool.close()
+
+
+@atexit.register
+def _close_all_cat_files():
+    """Stops the `git cat-file` processes of the repositories left open."""
+    with _cat_files_lock:
+        repository_dirs = set(repository_dir for (repository_dir, _) in _cat_files.keys())
+
+    for repository_dir in repository_dirs:
+        _close_cat_files(repository_dir)
+
+
 class Commit():
 
+    __slots__ = ("ref", "_repository_dir", "_commit_object")
+
     ref: str
     _repository_dir: str
+    _commit_object: Tuple[Dict[str, str], str]
 
     def __init__(self, ref: str, *, repository_dir: str):
         self.ref = ref
         self._repository_dir = repository_dir
 
+    def _read_commit_object(self) -> Tuple[Dict[str, str], str]:
+        """The commit headers and message, read and parsed once from the commit object."""
+        try:
+            return self._commit_object
+        except AttributeError:
+            pass
+
+        commit_object = _cat_file(self._repository_dir).read(self.ref)
+
+        if commit_object is None or commit_object[1] != "commit":
+            raise GitError(f"fatal: bad object {self.ref}", code=128)
+
+        self._commit_object = _parse_commit_object(commit_object[2])
+
+        return self._commit_object
+
     @property
     def datetime(self):
+        (headers, _) = self._read_commit_object()
+        (_, committer_timestamp, _) = headers["committer"].rsplit(" ", 2)
+
         return datetime.datetime.fromtimestamp(
-            float(git(
-                "show",
-                "-s",
-                r"--format=%ct",
-                self.ref,
-                cwd=self._repository_dir
-            ).strip()),
+            float(committer_timestamp),
             datetime.timezone.utc
         )
 
     @property
     def message(self):
-        return git(
-            "show",
-            "-s",
-            r"--format=%B",
-            self.ref,
-            cwd=self._repository_dir
-        ).strip()
+        return self._read_commit_object()[1].strip()
 
     @property
     def parent(self):
-        parent_ref = git(
-            "rev-list",
-            "-1",
-            self.ref,
-            cwd=self._repository_dir
-        ).strip()
+        (headers, _) = self._read_commit_object()
+        parent_ref = headers.get("parent")
 
         if parent_ref:
             return Commit(ref=parent_ref, repository_dir=self._repository_dir)
@@ -210,12 +494,37 @@ class Commit():
     def read(self, file: str, text: bool = True) -> str | bytes:
         file_name = os.path.relpath(file, self._repository_dir)
 
-        return git(
-            "show",
-            f"{self.ref}:{file_name}",
-            cwd=self._repository_dir,
-            text=text
-        )
+        try:
+            file_object = _cat_file(self._repository_dir).read(f"{self.ref}:{file_name}")
+        except ValueError:
+            return git(
+                "show",
+                f"{self.ref}:{file_name}",
+                cwd=self._repository_dir,
+                text=text
+            )
+
+        if file_object is None:
+            raise FileNotFoundError(f"fatal: path '{file_name}' does not exist in '{self.ref}'")
+
+        (_, _, content) = file_object
+
+        return _decode(content) if text else content
+
+    @contextlib.contextmanager
+    def open(self, file: str) -> Iterator[BinaryIO]:
+        """Streams a file as it is in this commit.
+
+        Raises:
+            FileNotFoundError:
+        """
+        file_name = os.path.relpath(file, self._repository_dir)
+
+        if "\n" in file_name:
+            yield io.BytesIO(self.read(file, text=False))
+        else:
+            with open_blob(f"{self.ref}:{file_name}", cwd=self._repository_dir) as blob_stream:
+                yield blob_stream
 
     @property
     def modified_files(self):
@@ -245,7 +554,9 @@ class RemoteRepository():
             raise ValueError(f"{repository_url} is not a git repository")
 
     @contextlib.contextmanager
-    def tempclone(self, dir: str = tempfile.mkdtemp(), env: Dict[str, str] = {}):
+    def tempclone(self, dir: Optional[str] = None, env: Dict[str, str] = {}):
+        if dir is None:
+            dir = tempfile.mkdtemp()
 
         try:
             git("clone", self._repository_url, dir, env=env)
@@ -256,9 +567,12 @@ class RemoteRepository():
 
             repository.push()
         finally:
+            _close_cat_files(dir)
             shutil.rmtree(dir, ignore_errors=True)
 
-    def clone(self, dir: str = tempfile.mkdtemp(), env: Dict[str, str] = {}):
+    def clone(self, dir: Optional[str] = None, env: Dict[str, str] = {}):
+        if dir is None:
+            dir = tempfile.mkdtemp()
 
         git("clone", self._repository_url, dir, env=env)
 
@@ -287,6 +601,10 @@ class LocalRepository():
                 cwd=repository_dir
             )
 
+    def close(self):
+        """Stops the long-running git processes reading from the repository."""
+        _close_cat_files(self._repository_dir)
+
     @property
     def is_lfs_installed(self) -> bool:
         try:
@@ -320,11 +638,22 @@ class LocalRepository():
         )
 
     def get_commit(self, ref: str) -> Optional[Commit]:
+        try:
+            ref_object = _cat_file(self._repository_dir, check=True).read(f"{ref}^{{commit}}")
+        except ValueError:
+            pass
+        except GitError:
+            return None
+        else:
+            return Commit(ref_object[0], repository_dir=self._repository_dir) if ref_object is not None else None
+
         try:
             result = git(
                 "rev-parse",
-                ref
-            )
+                "--verify",
+                f"{ref}^{{commit}}",
+                cwd=self._repository_dir
+            ).strip()
 
             return Commit(result, repository_dir=self._repository_dir)
         except GitError:
@@ -337,18 +666,36 @@ class LocalRepository():
     def head(self) -> Optional[Commit]:
         return self.get_commit("HEAD")
 
+    @property
+    def commits(self) -> Iterator[Commit]:
+        """Iterates over the commit history, from most to least recent. The history is listed at once."""
+        head = self.head
+
+        if head is None:
+            return
+
+        refs = git(
+            "rev-list",
+            "--first-parent",
+            head.ref,
+            cwd=self._repository_dir
+        ).split()
+
+        for ref in refs:
+            yield Commit(ref, repository_dir=self._repository_dir)
+
     def add(self, *added_files: str):
-        git(
+        _pathspec_git(
+            partial(git, cwd=self._repository_dir),
             "add",
-            *[os.path.relpath(modified_file, self._repository_dir) for modified_file in added_files],
-            cwd=self._repository_dir
+            *(os.path.relpath(file, self._repository_dir) for file in added_files)
         )
 
     def remove(self, *removed_files: str):
-        git(
+        _pathspec_git(
+            partial(git, cwd=self._repository_dir),
             "rm",
-            *[os.path.relpath(modified_file, self._repository_dir) for modified_file in removed_files],
-            cwd=self._repository_dir
+            *(os.path.relpath(file, self._repository_dir) for file in removed_files)
         )
 
     def stage_all(self):
@@ -430,6 +777,21 @@ class LocalRepository():
             text=text
         )
 
+    @contextlib.contextmanager
+    def open(self, file: str) -> Iterator[BinaryIO]:
+        """Streams a file as it is in the index.
+
+        Raises:
+            FileNotFoundError:
+        """
+        file_name = os.path.relpath(file, self._repository_dir)
+
+        if "\n" in file_name:
+            yield io.BytesIO(self.read(file, text=False))
+        else:
+            with open_blob(f":{file_name}", cwd=self._repository_dir) as blob_stream:
+                yield blob_stream
+
     @property
     def modified_files(self):
 
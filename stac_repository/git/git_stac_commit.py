@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import (
     Optional,
     Any,
+    List,
     Iterator,
     BinaryIO,
     TYPE_CHECKING
@@ -15,6 +16,8 @@ import os
 import io
 import orjson
 from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # from .git import (
 #     Commit,
@@ -32,6 +35,9 @@ from ..base_stac_commit import (
     BackupValueError,
     HrefError
 )
+from ..stac.stac_io import (
+    href_scheme
+)
 
 if TYPE_CHECKING:
     from .git_stac_repository import (
@@ -40,13 +46,25 @@ if TYPE_CHECKING:
     )
 
 
+@lru_cache(maxsize=4096)
+def _read_object_file(repository_dir: str, ref: str, file: str) -> bytes:
+    """Reads a STAC object file as it is in a commit. Commits are immutable, the most recently read files are kept
+    in memory, across all the commits of all the repositories.
+    """
+    return Commit(ref, repository_dir=repository_dir).read(file, text=False)
+
+
 class GitStacCommit(BaseStacCommit):
 
+    __slots__ = ("_git_commit", "_repository", "_base_path")
+
     _git_commit: Commit
     _repository: "GitStacRepository"
+    _base_path: str
 
     def __init__(self, repository: "GitStacRepository", commit: Optional[Commit] = None):
         self._repository = repository
+        self._base_path = posixpath.abspath(repository._local_repository._repository_dir)
 
         if commit is None:
             if repository._local_repository.head is not None:
@@ -56,6 +74,11 @@ class GitStacCommit(BaseStacCommit):
         else:
             self._git_commit = commit
 
+    @staticmethod
+    def clear_cache():
+        """Forgets the STAC object files kept in memory."""
+        _read_object_file.cache_clear()
+
     @property
     def id(self) -> str:
         return self._git_commit.ref
@@ -76,26 +99,40 @@ class GitStacCommit(BaseStacCommit):
         ) if self._git_commit.parent else None
 
     def _href_to_file(self, href: str):
-        if not _urlparse(href, scheme="").scheme == "":
+        if not href_scheme(href) == "":
             raise HrefError(f"{href} is an external ressource")
 
-        file = os.path.normpath(posixpath.abspath(self._repository._local_repository._repository_dir) + href)
+        file = os.path.normpath(self._base_path + href)
 
-        if not file.startswith(self._repository._local_repository._repository_dir):
-            raise HrefError(f"{href} is outside of repository {self._repository._local_repository._repository_dir}")
+        if not file.startswith(self._base_path):
+            raise HrefError(f"{href} is outside of repository {self._base_path}")
 
         return file
 
     def get(self, href: str) -> Any:
         file = self._href_to_file(href)
 
-        object_str = self._git_commit.read(file)
+        object_bytes = _read_object_file(self._git_commit._repository_dir, self._git_commit.ref, file)
 
         try:
-            return orjson.loads(object_str)
+            return orjson.loads(object_bytes)
         except orjson.JSONDecodeError as error:
             raise JSONObjectError from error
 
+    def get_many(self, hrefs: List[str]) -> List[Any]:
+        if len(hrefs) <= 1:
+            return super().get_many(hrefs)
+
+        def get(href: str) -> Any:
+            try:
+                return self.get(href)
+            except (HrefError, FileNotFoundError, JSONObjectError) as error:
+                return error
+
+        # Each worker reads through its own long-running git cat-file process, which is kept for the following reads
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            return list(executor.map(get, hrefs))
+
     @contextmanager
     def get_asset(self, href: str) -> Iterator[BinaryIO]:
         file = self._href_to_file(href)
@@ -104,7 +141,8 @@ class GitStacCommit(BaseStacCommit):
             pointer = self._git_commit.read(file)
             yield io.BytesIO(self._git_commit.lfs_smudge(pointer))
         else:
-            yield io.BytesIO(self._git_commit.read(file, text=False))
+            with self._git_commit.open(file) as asset_stream:
+                yield asset_stream
 
     def rollback(self):
         return NotImplementedError
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from typing import (
+    Iterator,
+    Union
+)
+
 import hashlib
 import tempfile
 import os
+import re
+import datetime
 
 from ..__about__ import __version__, __name_public__
 
@@ -24,6 +31,7 @@ from .git_stac_config import (
 from ..base_stac_repository import (
     BaseStacRepository,
     RepositoryNotFoundError,
+    CommitNotFoundError,
 )
 
 
@@ -39,6 +47,10 @@ class RollbackRefNotFoundError(RefNotFoundError):
     pass
 
 
+_COMMIT_ID_PREFIX = re.compile(r"[0-9a-f]{4,64}")
+"""Commit id prefixes long enough for git to resolve them."""
+
+
 class GitStacRepository(BaseStacRepository):
 
     StacConfig = GitStacConfig
@@ -63,3 +75,49 @@ class GitStacRepository(BaseStacRepository):
         )
 
         self._local_repository = self._remote_repository.clone(local_clone_path)
+
+    def __enter__(self) -> GitStacRepository:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stops the git processes kept running to read the repository objects, and forgets the object files kept
+        in memory. They are started (and read) again if the repository is read afterwards."""
+        self._local_repository.close()
+        GitStacCommit.clear_cache()
+
+    @property
+    def commits(self) -> Iterator[GitStacCommit]:
+        """Iterates over the commit history, from most to least recent.
+
+        Raises:
+            RepositoryNotFoundError: If the repository doesn't have any commit
+        """
+        is_empty = True
+
+        for commit in self._local_repository.commits:
+            is_empty = False
+            yield GitStacCommit(self, commit)
+
+        if is_empty:
+            raise RepositoryNotFoundError("Repository doesn't have any commit")
+
+    def get_commit(self, ref: Union[str, datetime.datetime, int]) -> GitStacCommit:
+        """Get a commit matching some ref. Commit ids (and their prefixes of at least 4 characters) are resolved by
+        git directly instead of walking the commit history.
+
+        Raises:
+            CommitNotFoundError: If no, or multiple, commits matching the ref are found.
+            RefTypeError: Invalid ref type
+        """
+        if isinstance(ref, str) and _COMMIT_ID_PREFIX.fullmatch(ref) is not None:
+            commit = self._local_repository.get_commit(ref)
+
+            if commit is None:
+                raise CommitNotFoundError
+
+            return GitStacCommit(self, commit)
+        else:
+            return super().get_commit(ref)
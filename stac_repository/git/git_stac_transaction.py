@@ -5,6 +5,7 @@ from typing import (
     Iterator,
     Optional,
     Union,
+    List,
     BinaryIO,
     TYPE_CHECKING
 )
@@ -12,7 +13,6 @@ from typing import (
 import os
 import io
 import shutil
-from urllib.parse import urlparse as _urlparse
 import posixpath
 from contextlib import contextmanager
 
@@ -29,6 +29,9 @@ from ..base_stac_commit import (
 from ..base_stac_transaction import (
     BaseStacTransaction
 )
+from ..stac.stac_io import (
+    href_scheme
+)
 
 if TYPE_CHECKING:
     from .git_stac_repository import GitStacRepository
@@ -38,30 +41,32 @@ class GitStacTransaction(BaseStacTransaction):
 
     _repository: "GitStacRepository"
     _git_repository: LocalRepository
+    _base_path: str
 
     def __init__(self, repository: "GitStacRepository"):
         self._repository = repository
 
         self._git_repository = repository._local_repository
+        self._base_path = posixpath.abspath(self._git_repository._repository_dir)
 
     def _href_to_file(self, href: str):
-        if not _urlparse(href, scheme="").scheme == "":
+        if not href_scheme(href) == "":
             raise HrefError(f"{href} is an external ressource")
 
-        file = os.path.normpath(posixpath.abspath(self._git_repository._repository_dir) + href)
+        file = os.path.normpath(self._base_path + href)
 
-        if not file.startswith(self._git_repository._repository_dir):
-            raise HrefError(f"{href} is outside of repository {self._git_repository._repository_dir}")
+        if not file.startswith(self._base_path):
+            raise HrefError(f"{href} is outside of repository {self._base_path}")
 
         return file
 
     def get(self, href: str) -> Any:
         file = self._href_to_file(href)
 
-        object_str = self._git_repository.read(file)
+        object_bytes = self._git_repository.read(file, text=False)
 
         try:
-            return orjson.loads(object_str)
+            return orjson.loads(object_bytes)
         except orjson.JSONDecodeError as error:
             raise JSONObjectError from error
 
@@ -73,7 +78,8 @@ class GitStacTransaction(BaseStacTransaction):
             pointer = self._git_repository.read(file)
             yield io.BytesIO(self._git_repository.lfs_smudge(pointer))
         else:
-            yield io.BytesIO(self._git_repository.read(file, text=False))
+            with self._git_repository.open(file) as asset_stream:
+                yield asset_stream
 
     def set(self, href: str, value: Any):
         file = self._href_to_file(href)
@@ -98,8 +104,7 @@ class GitStacTransaction(BaseStacTransaction):
         os.makedirs(os.path.dirname(file), exist_ok=True)
 
         with open(file, "w+b") as asset_stream:
-            while (chunk := value.read()):
-                asset_stream.write(chunk)
+            shutil.copyfileobj(value, asset_stream, 1024 * 1024)
 
         self._git_repository.add(file)
 
@@ -112,6 +117,38 @@ class GitStacTransaction(BaseStacTransaction):
         except FileNotFoundError:
             pass
 
+    def unset_many(self, hrefs: List[str]) -> List[Optional[HrefError]]:
+        errors: List[Optional[HrefError]] = []
+        removed_files: List[str] = []
+
+        for href in hrefs:
+            try:
+                file = self._href_to_file(href)
+            except HrefError as error:
+                errors.append(error)
+                continue
+
+            try:
+                os.remove(file)
+            except FileNotFoundError:
+                pass
+            else:
+                removed_files.append(file)
+
+            errors.append(None)
+
+        if removed_files:
+            try:
+                self._git_repository.remove(*removed_files)
+            except FileNotFoundError:
+                for file in removed_files:
+                    try:
+                        self._git_repository.remove(file)
+                    except FileNotFoundError:
+                        pass
+
+        return errors
+
     def abort(self):
         self._git_repository.reset(clean_modified_files=True)
 
@@ -20,6 +20,8 @@ class JobReport(NamedTuple):
 
 class JobReportBuilder():
 
+    __slots__ = ("_context",)
+
     _context: str
 
     def __init__(
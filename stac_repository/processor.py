@@ -19,6 +19,8 @@ class Processor(Protocol):
     def discover(source: str) -> Iterator[str]:
         """_Discover products from a source._
 
+        Sources are discovered concurrently, this method may be called from several threads at once.
+
         Args:
             source: _A data source, typically an uri or directory path depending on where the products are stored_
 
@@ -32,6 +34,8 @@ class Processor(Protocol):
     def id(product_source: str) -> str:
         """_Get the id of a product_
 
+        Products are identified ahead of being ingested, this method may be called from several threads at once.
+
         Args:
             product_source: _The product source, typically an uri or file path_
 
@@ -45,6 +49,8 @@ class Processor(Protocol):
     def version(product_source: str) -> str:
         """_Get a product version_
 
+        Products are identified ahead of being ingested, this method may be called from several threads at once.
+
         Args:
             product_source: _The product source, typically an uri or file path_
 
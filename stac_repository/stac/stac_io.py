@@ -5,6 +5,9 @@ from typing import (
     Any,
     Optional,
     Dict,
+    List,
+    Tuple,
+    Callable,
     Iterator,
     BinaryIO,
     cast
@@ -12,12 +15,11 @@ from typing import (
 
 from enum import Flag
 
-from contextlib import contextmanager
+from contextlib import contextmanager, AbstractContextManager
 
 import os
-from urllib.parse import (
-    urlparse as _urlparse,
-)
+import re
+import shutil
 
 import orjson
 import requests
@@ -37,8 +39,23 @@ class HrefError(ValueError):
     pass
 
 
+_SCHEME = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+def href_scheme(href: str) -> str:
+    """Returns the (lowercased) scheme of an href, or the empty string if it has none (i.e. a file path).
+
+    Same as `urlparse(href).scheme`, without parsing the rest of the href.
+    """
+    scheme = _SCHEME.match(href)
+
+    return scheme.group()[:-1].lower() if scheme is not None else ""
+
+
 class ReadableStacIO(Protocol):
 
+    __slots__ = ()
+
     def get(self, href: str) -> Any:
         """Reads a JSON object.
 
@@ -53,6 +70,23 @@ class ReadableStacIO(Protocol):
         """
         ...
 
+    def get_many(self, hrefs: List[str]) -> List[Any]:
+        """Reads several JSON objects.
+
+        Implementations may read the objects concurrently, the default implementation reads them one after the other.
+
+        Returns:
+            For each href, the JSON object, or the HrefError, FileNotFoundError or JSONObjectError which prevented
+            it from being read
+        """
+        def get(href: str) -> Any:
+            try:
+                return self.get(href)
+            except (HrefError, FileNotFoundError, JSONObjectError) as error:
+                return error
+
+        return [get(href) for href in hrefs]
+
     @contextmanager
     def get_asset(self, href: str) -> Iterator[BinaryIO]:
         """Reads a binary Object.
@@ -75,6 +109,8 @@ class ReadableStacIO(Protocol):
 
 class StacIO(ReadableStacIO):
 
+    __slots__ = ()
+
     def set(self, href: str, value: Any):
         """(Over)writes a JSON object, which is a valid representation of a STAC object.
 
@@ -94,6 +130,28 @@ class StacIO(ReadableStacIO):
         """
         ...
 
+    def set_assets(
+        self,
+        assets: List[Tuple[str, Callable[[], AbstractContextManager[BinaryIO]]]]
+    ) -> List[Optional[Exception]]:
+        """(Over)writes several binary Objects, each `(href, value)` pair opening its own source stream.
+
+        Implementations may write the assets concurrently, the default implementation writes them one after the other.
+
+        Returns:
+            For each asset, the HrefError or FileNotFoundError which prevented it from being saved, or None
+        """
+        def set_asset(href: str, value: Callable[[], AbstractContextManager[BinaryIO]]) -> Optional[Exception]:
+            try:
+                with value() as asset_stream:
+                    self.set_asset(href, asset_stream)
+            except (HrefError, FileNotFoundError) as error:
+                return error
+            else:
+                return None
+
+        return [set_asset(href, value) for (href, value) in assets]
+
     def unset(self, href: str):
         """Deletes whatever object (if it exists) at `href`.
 
@@ -102,6 +160,24 @@ class StacIO(ReadableStacIO):
         """
         ...
 
+    def unset_many(self, hrefs: List[str]) -> List[Optional[HrefError]]:
+        """Deletes whatever objects (if they exist) at `hrefs`.
+
+        Implementations may delete the objects in a single batch, the default implementation deletes them one after the other.
+
+        Returns:
+            For each href, the HrefError which prevented it from being deleted, or None
+        """
+        def unset(href: str) -> Optional[HrefError]:
+            try:
+                self.unset(href)
+            except HrefError as error:
+                return error
+            else:
+                return None
+
+        return [unset(href) for href in hrefs]
+
 
 class StacIOPerm(Flag):
     NONE = 0
@@ -128,29 +204,39 @@ class StacIOPerm(Flag):
 class DefaultReadableStacIO(ReadableStacIO):
     """A default implementation of `ReadableStacIO` operating on the local filesystem and over http(s)."""
 
+    __slots__ = ("_perms", "_scopes")
+
     _perms: Dict[str, StacIOPerm]
+    _scopes: Dict[StacIOPerm, Tuple[str, ...]]
+    """Base hrefs granting each required permission, checked with a single `str.startswith`."""
 
     def __init__(self, perms: Dict[str, StacIOPerm] = {}) -> None:
         self._perms = perms
+        self._scopes = {}
 
     def check_perms(self, href: str, required_perm: StacIOPerm) -> bool:
-        for (base_href, perm) in self._perms.items():
-            if required_perm in perm and href.startswith(base_href):
-                return True
+        scope = self._scopes.get(required_perm)
 
-        return False
+        if scope is None:
+            scope = self._scopes[required_perm] = tuple(
+                base_href
+                for (base_href, perm) in self._perms.items()
+                if required_perm in perm
+            )
+
+        return href.startswith(scope)
 
     @staticmethod
     def _is_file_href(href: str) -> bool:
-        return _urlparse(href, scheme="").scheme == ""
+        return href_scheme(href) == ""
 
     def get(self, href: str) -> Any:
         if not self.check_perms(href, StacIOPerm.R_STAC):
             raise HrefError(f"{href} is not within readable scope")
 
-        href_scheme = _urlparse(href, scheme="").scheme
+        scheme = href_scheme(href)
 
-        if href_scheme == "":
+        if scheme == "":
             os_href = os.path.abspath(href)
 
             with open(os_href, "r+b") as object_stream:
@@ -158,7 +244,7 @@ class DefaultReadableStacIO(ReadableStacIO):
                     return orjson.loads(object_stream.read())
                 except orjson.JSONDecodeError as error:
                     raise JSONObjectError from error
-        elif href_scheme in ["http", "https"]:
+        elif scheme in ["http", "https"]:
             response = requests.get(href)
 
             if response.status_code == 404:
@@ -167,8 +253,8 @@ class DefaultReadableStacIO(ReadableStacIO):
                 response.raise_for_status()
 
             try:
-                return response.json()
-            except requests.JSONDecodeError as error:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError as error:
                 raise JSONObjectError from error
         else:
             raise HrefError(f"{href} cannot be fetched, it is neither a file nor a http(s) URI.")
@@ -178,14 +264,14 @@ class DefaultReadableStacIO(ReadableStacIO):
         if not self.check_perms(href, StacIOPerm.R_ASSETS):
             raise HrefError(f"{href} is not within readable assets scope")
 
-        href_scheme = _urlparse(href, scheme="").scheme
+        scheme = href_scheme(href)
 
-        if href_scheme == "":
+        if scheme == "":
             os_href = os.path.abspath(href)
 
             with open(os_href, "r+b") as asset_stream:
                 yield asset_stream
-        elif href_scheme in ["http", "https"]:
+        elif scheme in ["http", "https"]:
             response = requests.get(href, stream=True)
 
             yield cast(BinaryIO, response.raw)
@@ -196,11 +282,13 @@ class DefaultReadableStacIO(ReadableStacIO):
 class DefaultStacIO(DefaultReadableStacIO, StacIO):
     """A default implementation of `StacIO` operating on the local filesystem."""
 
+    __slots__ = ()
+
     def set(self, href: str, value: Any):
         if not self.check_perms(href, StacIOPerm.RW_STAC):
             raise HrefError(f"{href} is not within writeable scope")
 
-        if _urlparse(href, scheme="").scheme != "":
+        if href_scheme(href) != "":
             raise HrefError(f"{href} cannot be set, it is not a file")
 
         os_href = os.path.abspath(href)
@@ -217,7 +305,7 @@ class DefaultStacIO(DefaultReadableStacIO, StacIO):
         if not self.check_perms(href, StacIOPerm.RW_ASSETS):
             raise HrefError(f"{href} is not within writeable assets scope")
 
-        if _urlparse(href, scheme="").scheme != "":
+        if href_scheme(href) != "":
             raise HrefError(f"{href} cannot be set, it is not a file")
 
         os_href = os.path.abspath(href)
@@ -225,14 +313,13 @@ class DefaultStacIO(DefaultReadableStacIO, StacIO):
         os.makedirs(os.path.dirname(os_href), exist_ok=True)
 
         with open(os_href, "w+b") as asset_stream:
-            while (chunk := value.read()):
-                asset_stream.write(chunk)
+            shutil.copyfileobj(value, asset_stream, 1024 * 1024)
 
     def unset(self, href: str):
         if not self.check_perms(href, StacIOPerm.RW_ANY):
             raise HrefError(f"{href} is not within writeable scope")
 
-        if _urlparse(href, scheme="").scheme != "":
+        if href_scheme(href) != "":
             raise HrefError(f"{href} cannot be unset, it is not a file")
 
         os_href = os.path.abspath(href)
@@ -6,6 +6,11 @@ from typing import (
     Union,
     List,
     Dict,
+    Type,
+    Deque,
+    FrozenSet,
+    Any,
+    NamedTuple,
     overload
 )
 
@@ -16,6 +21,8 @@ import os
 import shutil
 import datetime
 import posixpath
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import (
     urljoin,
     urlparse as _urlparse
@@ -33,7 +40,6 @@ from pydantic import (
 )
 
 from .models import (
-    StacObject,
     Item,
     Collection,
     Catalog,
@@ -64,17 +70,45 @@ class VersionNotFoundError(ValueError):
     pass
 
 
+_stac_object_types: Dict[str, Type[Union[Item, Collection, Catalog]]] = {
+    "Feature": Item,
+    "Collection": Collection,
+    "Catalog": Catalog,
+}
+
+_saved_child_href_formats: Dict[type, str] = {
+    Item: "./{id}/{id}.json",
+    Collection: "./{id}/collection.json",
+    Catalog: "./{id}/catalog.json",
+}
+
+_saved_parent_hrefs: Dict[type, str] = {
+    Collection: "../collection.json",
+    Catalog: "../catalog.json",
+}
+
+
+@lru_cache(maxsize=256)
+def _urlbase(base_href: str) -> Tuple[Tuple[str, str], str]:
+    """Splits a base href into its (scheme, netloc) and its relative directory path.
+
+    Every link and asset of an object is made relative to the same base href, parse it once.
+    """
+    base_url = _urlparse(base_href, scheme="")
+
+    return (base_url[0:2], "." + posixpath.dirname(base_url.path))
+
+
 def urlrel(href: str, base_href: str) -> str:
 
     url = _urlparse(href, scheme="")
-    base_url = _urlparse(base_href, scheme="")
+    (base_location, base_dir_path) = _urlbase(base_href)
 
     if url.scheme == "" and not posixpath.isabs(href):
         rel_href = href
-    elif url[0:2] != base_url[0:2]:
+    elif url[0:2] != base_location:
         rel_href = href
     else:
-        base_dir_path = "." + posixpath.dirname(base_url.path)
         path = "." + url.path
 
         rel_href = posixpath.relpath(path, base_dir_path)
@@ -86,46 +120,63 @@ def urlpath(href: str) -> str:
     return _urlparse(href).path
 
 
-def load(
+def _get_json_object(
     href: str,
     *,
-    resolve_descendants: bool = False,
-    resolve_assets: bool = False,
     io: ReadableStacIO,
-) -> Union[Item, Collection, Catalog]:
-    """Loads and validates a STAC object.
-
-    Computes Link and Asset absolute hrefs.
-
-    If `recursive` is True, the Object descendants (children and items) are loaded too.
-
-    **Descendants which do not exist (i.e. FileNotFoundError) or are not valid
-    STAC Objects (i.e. StacObjectError) are ignored (and removed from their parent links).**
+) -> Dict[str, Any]:
+    """Retrieves the JSON representation of a STAC object, only checking its type.
 
     Raises:
-        FileNotFoundError: The (root) href doesn't exist
-        StacObjectError: The retrieved (root) JSON object is not a valid representation of a STAC object
-        HrefError: The (root) href cannot be processed by this StacIO instance
+        FileNotFoundError: The href doesn't exist
+        StacObjectError: The retrieved JSON object is not a STAC object
+        HrefError: The href cannot be processed by this StacIO instance
     """
     try:
         json_object = io.get(href)
     except JSONObjectError as error:
         raise StacObjectError(f"{href} is not a JSON object : {str(error)}") from error
 
-    try:
-        typed_object = StacObject.model_validate(json_object)
-    except ValidationError:
+    return _check_json_object(href, json_object)
+
+
+def _check_json_object(
+    href: str,
+    json_object: Any,
+) -> Dict[str, Any]:
+    """Checks the type of the JSON representation of a STAC object retrieved from `href` (or the error raised
+    retrieving it).
+
+    Raises:
+        FileNotFoundError: The href doesn't exist
+        StacObjectError: The retrieved JSON object is not a STAC object
+        HrefError: The href cannot be processed by this StacIO instance
+    """
+    if isinstance(json_object, JSONObjectError):
+        raise StacObjectError(f"{href} is not a JSON object : {str(json_object)}") from json_object
+    elif isinstance(json_object, Exception):
+        raise json_object
+
+    if not isinstance(json_object, dict) or "type" not in json_object:
         raise StacObjectError(f"{href} is not a STAC object : missing 'type' property")
 
+    if not isinstance(json_object["type"], str) or json_object["type"] not in _stac_object_types:
+        raise StacObjectError(f"{href} doesn't have a valid STAC object type : '{json_object['type']}'")
+
+    return json_object
+
+
+def _validate(
+    href: str,
+    json_object: Dict[str, Any],
+) -> Union[Item, Collection, Catalog]:
+    """Validates the JSON representation of a STAC object retrieved from `href`. Computes Link and Asset absolute hrefs.
+
+    Raises:
+        StacObjectError: The JSON object is not a valid representation of a STAC object
+    """
     try:
-        if typed_object.type == "Feature":
-            stac_object = Item.model_validate(json_object, context=href)
-        elif typed_object.type == "Collection":
-            stac_object = Collection.model_validate(json_object, context=href)
-        elif typed_object.type == "Catalog":
-            stac_object = Catalog.model_validate(json_object, context=href)
-        else:
-            raise StacObjectError(f"{href} doesn't have a valid STAC object type : '{typed_object.type}'")
+        stac_object = _stac_object_types[json_object["type"]].model_validate(json_object, context=href)
     except ValidationError as error:
         raise StacObjectError(f"{href} is not a valid STAC object : {str(error)}") from error
 
@@ -136,47 +187,100 @@ def load(
         for asset in stac_object.assets.values():
             asset.href = urljoin(href, asset.href)
 
-            if resolve_assets:
-                asset.target = lambda href=asset.href: io.get_asset(href)
+    return stac_object
+
+
+def _resolve_assets(
+    stac_object: Union[Item, Collection, Catalog],
+    *,
+    io: ReadableStacIO,
+):
+    """Sets the assets targets of a STAC object, reading them from `io` when called."""
+    if isinstance(stac_object, (Item, Collection)) and stac_object.assets is not None:
+        get_asset = io.get_asset
+
+        for asset in stac_object.assets.values():
+            asset.target = partial(get_asset, asset.href)
+
+
+def load(
+    href: str,
+    *,
+    resolve_descendants: bool = False,
+    resolve_assets: bool = False,
+    io: ReadableStacIO,
+) -> Union[Item, Collection, Catalog]:
+    """Loads and validates a STAC object.
+
+    Computes Link and Asset absolute hrefs.
+
+    If `resolve_descendants` is True, the Object descendants (children and items) are loaded too, walking
+    the tree iteratively.
+
+    **Descendants which do not exist (i.e. FileNotFoundError) or are not valid
+    STAC Objects (i.e. StacObjectError) are ignored (and removed from their parent links).**
+
+    Raises:
+        FileNotFoundError: The (root) href doesn't exist
+        StacObjectError: The retrieved (root) JSON object is not a valid representation of a STAC object, or one of
+            its descendants links back to one of its ancestors
+        HrefError: The (root) href cannot be processed by this StacIO instance
+    """
+    stac_object = _validate(href, _get_json_object(href, io=io))
+
+    if resolve_assets:
+        _resolve_assets(stac_object, io=io)
 
     if resolve_descendants:
-        resolved_links: List[Link] = []
+        unresolved_stac_objects: Deque[Tuple[Union[Item, Collection, Catalog], FrozenSet[str]]] = deque([
+            (stac_object, frozenset([href]))
+        ])
 
-        for link in stac_object.links:
-            if link.rel not in ["child", "item"]:
-                resolved_links.append(link)
-            else:
-                try:
-                    child = load(
-                        link.href,
-                        resolve_descendants=resolve_descendants,
-                        resolve_assets=resolve_assets,
-                        io=io,
-                    )
-                except HrefError as error:
-                    logger.exception(
-                        f"[{type(error).__name__}] Ignored child {link.href} link resolution : {str(error)}"
-                    )
+        while unresolved_stac_objects:
+            (parent, ancestor_hrefs) = unresolved_stac_objects.pop()
+
+            child_hrefs = [link.href for link in parent.links if link.rel in ["child", "item"]]
+
+            for child_href in child_hrefs:
+                if child_href in ancestor_hrefs:
+                    raise StacObjectError(f"{child_href} is its own descendant, the catalog links form a cycle")
+
+            child_json_objects = dict(zip(child_hrefs, io.get_many(child_hrefs)))
+
+            resolved_links: List[Link] = []
+
+            for link in parent.links:
+                if link.rel not in ["child", "item"]:
                     resolved_links.append(link)
-                except (FileNotFoundError, StacObjectError) as error:
-                    logger.exception(
-                        f"[{type(error).__name__}] Stipped child {link.href} from parent links : {str(error)}"
-                    )
                 else:
-                    link.target = child
+                    try:
+                        child = _validate(link.href, _check_json_object(link.href, child_json_objects[link.href]))
+
+                        if resolve_assets:
+                            _resolve_assets(child, io=io)
+                    except HrefError as error:
+                        logger.exception(
+                            f"[{type(error).__name__}] Ignored child {link.href} link resolution : {str(error)}"
+                        )
+                        resolved_links.append(link)
+                    except (FileNotFoundError, StacObjectError) as error:
+                        logger.exception(
+                            f"[{type(error).__name__}] Stipped child {link.href} from parent links : {str(error)}"
+                        )
+                    else:
+                        link.target = child
+
+                        back_rels = ("parent", "collection") if isinstance(
+                            child, Item) and isinstance(parent, Collection) else ("parent",)
 
-                    for child_link in child.links:
-                        if child_link.rel == "parent":
-                            child_link.target = stac_object
-
-                    if isinstance(child, Item) and isinstance(stac_object, Collection):
                         for child_link in child.links:
-                            if child_link.rel == "collection":
-                                child_link.target = stac_object
+                            if child_link.rel in back_rels:
+                                child_link.target = parent
 
-                    resolved_links.append(link)
+                        resolved_links.append(link)
+                        unresolved_stac_objects.append((child, ancestor_hrefs | {link.href}))
 
-        stac_object.links = resolved_links
+            parent.links = resolved_links
 
     return stac_object
 
@@ -293,21 +397,19 @@ def unset_parent(
     """
 
     links: List[Link] = []
-    parent: Optional[Union[Item, Collection, Catalog]] = None
+    parents: Dict[int, Union[Item, Collection, Catalog]] = {}
 
     for link in stac_object.links:
-        if link.rel == "parent":
+        if link.rel in ("parent", "collection"):
             if link.target is not None:
-                parent = link.target
-                parent.links = [link for link in parent.links if link.href != stac_object.self_href]
-        elif link.rel == "collection":
-            if link.target is not None:
-                parent = link.target
-                parent.links = [link for link in parent.links if link.href != stac_object.self_href]
+                parents[id(link.target)] = link.target
         else:
             links.append(link)
 
-    if isinstance(stac_object, Item) and parent is not None and isinstance(parent, Collection):
+    for parent in parents.values():
+        parent.links = [link for link in parent.links if link.href != stac_object.self_href]
+
+    if isinstance(stac_object, Item) and any(isinstance(parent, Collection) for parent in parents.values()):
         stac_object.collection = None
 
     stac_object.links = links
@@ -319,39 +421,95 @@ def search(
     *,
     io: ReadableStacIO,
 ) -> Optional[Union[Item, Collection, Catalog]]:
-    """Walks the catalog - without loading it all into memory at once - to find a STAC object with some id."""
+    """Walks the catalog - without loading it all into memory at once - to find a STAC object with some id.
 
-    if isinstance(root_href, str):
-        try:
-            stac_object = load(
-                root_href,
-                io=io,
-            )
-        except (FileNotFoundError, StacObjectError, HrefError) as error:
-            logger.exception(f"[{type(error).__name__}] Ignored {root_href} : {str(error)}")
-            return None
-    else:
-        stac_object = root_href
+    Objects are only read as plain JSON objects along the way, the found object and its ancestors are the only ones
+    validated. The parent links of the found object ancestors are resolved, so that loading them again
+    (i.e. `load_parent`) is free.
+    """
 
-    if stac_object.id == id:
-        return stac_object
-    elif isinstance(stac_object, (Collection, Catalog)):
-        for link in stac_object.links:
-            if link.rel not in ("item", "child"):
+    hrefs: Deque[Tuple[Union[str, Item, Collection, Catalog], Optional[_SearchNode]]] = deque([
+        (root_href, None)
+    ])
+
+    while hrefs:
+        (href, parent_node) = hrefs.pop()
+
+        object_id: Any
+        child_hrefs: List[str]
+
+        if isinstance(href, str):
+            try:
+                json_object = _get_json_object(
+                    href,
+                    io=io,
+                )
+
+                object_id = json_object.get("id")
+                child_hrefs = [] if json_object["type"] == "Feature" else [
+                    urljoin(href, link["href"])
+                    for link in json_object.get("links", [])
+                    if link.get("rel") in ("item", "child")
+                ]
+            except (FileNotFoundError, StacObjectError, HrefError) as error:
+                logger.exception(f"[{type(error).__name__}] Ignored {href} : {str(error)}")
+                continue
+            except (KeyError, AttributeError, TypeError) as error:
+                logger.exception(f"[{type(error).__name__}] Ignored {href}, it has malformed links : {str(error)}")
                 continue
 
-            found_object = search(
-                link.href,
-                id,
-                io=io,
-            )
+            node = _SearchNode(href, json_object, parent_node)
+        else:
+            object_id = href.id
+            child_hrefs = [] if isinstance(href, Item) else [
+                link.href
+                for link in href.links
+                if link.rel in ("item", "child")
+            ]
+
+            node = _SearchNode(href.self_href, href, parent_node)
+
+        if object_id == id:
+            stac_object = node.validate()
+
+            if stac_object is not None:
+                child = stac_object
 
-            if found_object is not None:
-                return found_object
+                while (node := node.parent) is not None and (parent := node.validate()) is not None:
+                    for link in child.links:
+                        if link.rel == "parent" and link.target is None and link.href == parent.self_href:
+                            link.target = parent
+
+                    child = parent
+
+                return stac_object
+        else:
+            hrefs.extend(reversed([
+                (child_href, node)
+                for child_href in child_hrefs
+            ]))
 
     return None
 
 
+class _SearchNode(NamedTuple):
+    """An object visited by `search`, along with the visited parent it was reached from."""
+
+    href: str
+    value: Union[Dict[str, Any], Item, Collection, Catalog]
+    parent: Optional[_SearchNode]
+
+    def validate(self) -> Optional[Union[Item, Collection, Catalog]]:
+        if not isinstance(self.value, dict):
+            return self.value
+
+        try:
+            return _validate(self.href, self.value)
+        except StacObjectError as error:
+            logger.exception(f"[{type(error).__name__}] Ignored {self.href} : {str(error)}")
+            return None
+
+
 def save(
     stac_object: Union[Item, Collection, Catalog],
     *,
@@ -359,39 +517,63 @@ def save(
 ):
     """Normalizes and saves a STAC object and its resolved descendants and assets.
 
+    Descendants are walked iteratively and written before their ancestors.
+
     Raises:
         HrefError: Stac object could not be saved to its self_href
     """
 
+    stac_objects: Deque[Union[Item, Collection, Catalog]] = deque([stac_object])
+    normalized_stac_objects: List[Union[Item, Collection, Catalog]] = []
+
+    while stac_objects:
+        normalized_stac_object = stac_objects.pop()
+        stac_objects.extend(_normalize(normalized_stac_object, io=io))
+        normalized_stac_objects.append(normalized_stac_object)
+
+    for normalized_stac_object in reversed(normalized_stac_objects):
+        try:
+            io.set(normalized_stac_object.self_href, normalized_stac_object.model_dump())
+        except HrefError as error:
+            if normalized_stac_object is stac_object:
+                raise error
+
+
+def _normalize(
+    stac_object: Union[Item, Collection, Catalog],
+    *,
+    io: StacIO,
+) -> List[Union[Item, Collection, Catalog]]:
+    """Normalizes the links of a STAC object and saves its assets. Returns its resolved children, with
+    their self_href set.
+    """
+
+    children: List[Union[Item, Collection, Catalog]] = []
+
+    self_href = stac_object.self_href
+
     saved_links: List[Link] = []
 
     for link in stac_object.links:
         if link.rel in ["self", "root", "alternate"]:
             continue
 
-        link.href = urlrel(link.href, stac_object.self_href)
+        link.href = urlrel(link.href, self_href)
 
         if link.target is None:
             saved_links.append(link)
         elif link.rel in ["child", "item"]:
             child = link.target
-            saved_child_href: str
-
-            if isinstance(child, Item):
-                saved_child_href = posixpath.join(".", child.id, f"{child.id}.json")
-            elif isinstance(child, Collection):
-                saved_child_href = posixpath.join(".", child.id, "collection.json")
-            elif isinstance(child, Catalog):
-                saved_child_href = posixpath.join(".", child.id, "catalog.json")
-            else:
+            saved_child_href_format = _saved_child_href_formats.get(type(child))
+
+            if saved_child_href_format is None:
                 raise TypeError(f"Unexpected child type : {type(child).__name__}")
 
-            child.self_href = urljoin(stac_object.self_href, saved_child_href)
+            saved_child_href = saved_child_href_format.format(id=child.id)
 
-            try:
-                save(child, io=io)
-            except HrefError as error:
-                pass
+            child.self_href = urljoin(self_href, saved_child_href)
+
+            children.append(child)
 
             link.href = saved_child_href
 
@@ -399,21 +581,20 @@ def save(
 
         elif link.rel == "parent":
             parent = link.target
+            saved_parent_href = _saved_parent_hrefs.get(type(parent))
 
-            if isinstance(parent, Collection):
-                link.href = posixpath.join("..", "collection.json")
-            elif isinstance(parent, Catalog):
-                link.href = posixpath.join("..", "catalog.json")
-            else:
+            if saved_parent_href is None:
                 raise TypeError(f"Unexpected parent type : {type(parent).__name__}")
 
+            link.href = saved_parent_href
+
             saved_links.append(link)
 
         elif link.rel == "collection":
             parent = link.target
 
             if isinstance(parent, Collection):
-                link.href = posixpath.join("..", "collection.json")
+                link.href = "../collection.json"
             else:
                 raise TypeError(f"Unexpected collection type : {type(parent).__name__}")
 
@@ -422,33 +603,42 @@ def save(
     stac_object.links = saved_links
 
     if isinstance(stac_object, (Item, Collection)) and stac_object.assets is not None:
-        saved_assets: Dict[str, Asset] = {}
+        ignored_asset_keys: List[str] = []
+
+        saved_asset_hrefs: Dict[str, str] = {
+            key: "./assets/" + posixpath.basename(urlpath(asset.href))
+            for (key, asset) in stac_object.assets.items()
+            if asset.target is not None
+        }
+
+        asset_errors = dict(zip(
+            saved_asset_hrefs.keys(),
+            io.set_assets([
+                (urljoin(self_href, saved_asset_href), stac_object.assets[key].target)
+                for (key, saved_asset_href) in saved_asset_hrefs.items()
+            ])
+        ))
 
         for (key, asset) in stac_object.assets.items():
-            if asset.target is not None:
-                saved_asset_href = posixpath.join(".", "assets", posixpath.basename(urlpath(asset.href)))
+            if key in saved_asset_hrefs:
+                error = asset_errors[key]
 
-                try:
-                    with asset.target() as asset_stream:
-                        io.set_asset(urljoin(stac_object.self_href, saved_asset_href), asset_stream)
-                except FileNotFoundError as error:
+                if isinstance(error, FileNotFoundError):
                     logger.exception(
-                        f"[{type(error).__name__}] Ignored asset {urljoin(stac_object.self_href, asset.href)} : {str(error)}"
+                        f"[{type(error).__name__}] Ignored asset {urljoin(self_href, asset.href)} : {str(error)}",
+                        exc_info=error
                     )
-                except HrefError as error:
-                    saved_assets[key] = asset
-                else:
-                    asset.href = saved_asset_href
-                    asset.target = lambda href=urljoin(stac_object.self_href, asset.href): io.get_asset(href)
-
-                    saved_assets[key] = asset
+                    ignored_asset_keys.append(key)
+                elif not isinstance(error, HrefError):
+                    asset.href = saved_asset_hrefs[key]
+                    asset.target = partial(io.get_asset, urljoin(self_href, asset.href))
             else:
-                asset.href = urlrel(asset.href, stac_object.self_href)
-                saved_assets[key] = asset
+                asset.href = urlrel(asset.href, self_href)
 
-        stac_object.assets = saved_assets
+        for key in ignored_asset_keys:
+            del stac_object.assets[key]
 
-    io.set(stac_object.self_href, stac_object.model_dump())
+    return children
 
 
 def export(
@@ -535,33 +725,40 @@ def delete(
     io: StacIO,
 ):
     """Deletes a STAC object and all its descendants and assets as best as it can.
+
+    The whole subtree is walked first, then deleted with a single `io.unset_many`.
     """
+    io.unset_many(_list_deleted_hrefs(href_or_stac_object, io=io))
+
+
+def _list_deleted_hrefs(
+    href_or_stac_object: Union[str, Item, Collection, Catalog],
+    *,
+    io: StacIO,
+) -> List[str]:
+    """Lists the hrefs of a STAC object, all its descendants and assets, in the order they should be deleted."""
     href: str
     stac_object: Optional[Union[Item, Collection, Catalog]] = None
 
-    def silent_unset(href: str):
-        try:
-            io.unset(href)
-        except HrefError as error:
-            pass
+    deleted_hrefs: List[str] = []
 
-    def delete_assets(stac_object: Union[Item, Collection, Catalog]):
+    def list_assets(stac_object: Union[Item, Collection, Catalog]):
         if isinstance(stac_object, (Item, Collection)) and stac_object.assets is not None:
             for asset in stac_object.assets.values():
-                silent_unset(asset.href)
+                deleted_hrefs.append(asset.href)
 
-    def delete_children(stac_object: Union[Item, Collection, Catalog]):
+    def list_children(stac_object: Union[Item, Collection, Catalog]):
         if isinstance(stac_object, (Collection, Catalog)):
             for link in stac_object.links:
                 if link.rel in ["child", "item"]:
-                    delete(link.href, io=io)
+                    deleted_hrefs.extend(_list_deleted_hrefs(link.href, io=io))
 
     if isinstance(href_or_stac_object, (Item, Collection, Catalog)):
         stac_object = href_or_stac_object
 
-        delete_assets(stac_object)
-        delete_children(stac_object)
-        silent_unset(stac_object.self_href)
+        list_assets(stac_object)
+        list_children(stac_object)
+        deleted_hrefs.append(stac_object.self_href)
 
     elif isinstance(href_or_stac_object, str):
         href = href_or_stac_object
@@ -572,21 +769,23 @@ def delete(
                 io=io,
             )
         except FileNotFoundError as error:
-            return
+            pass
         except HrefError as error:
-            return
+            pass
         except StacObjectError as error:
             logger.exception(
                 f"[{type(error).__name__}] {href} is not a valid Stac object - removing it may create unreachable orphans : {str(error)}"
             )
-            silent_unset(href)
+            deleted_hrefs.append(href)
         else:
-            delete_assets(stac_object)
-            delete_children(stac_object)
-            silent_unset(href)
+            list_assets(stac_object)
+            list_children(stac_object)
+            deleted_hrefs.append(href)
     else:
         raise TypeError(f"{type(href_or_stac_object)} is neither a Stac object or uri")
 
+    return deleted_hrefs
+
 
 @overload
 def fromisoformat(datetime_s: Union[str, datetime.datetime]) -> datetime.datetime:
@@ -633,6 +832,102 @@ def toisoformat(datetime_t: Optional[Union[str, datetime.datetime]]) -> Optional
         raise TypeError(f"{str(datetime_t)} is not a datetime")
 
 
+def _get_item_bounds(
+    item: Item
+) -> Tuple[Tuple[float, float, float, float], Tuple[datetime.datetime, datetime.datetime]]:
+    """Retrieves an item bbox and datetimes.
+
+    Raises:
+        StacObjectError: If the item geospatial properties are not valid
+    """
+    bbox: Tuple[float, float, float, float]
+    datetimes: Tuple[datetime.datetime, datetime.datetime]
+
+    if item.bbox is not None:
+        if len(item.bbox) != 4:
+            raise NotImplementedError(f"3-dimensional bbox encountered on item {item.id}")
+
+        bbox = item.bbox
+    elif item.geometry is not None:
+        bbox = shapely.geometry.shape(item.geometry).bounds
+    else:
+        raise StacObjectError(f"Item {item.id} missing geometry or bbox")
+
+    if item.properties.start_datetime is not None and item.properties.end_datetime is not None:
+        datetimes = (
+            fromisoformat(item.properties.start_datetime),
+            fromisoformat(item.properties.end_datetime)
+        )
+    elif item.properties.datetime is not None:
+        datetimes = (
+            fromisoformat(item.properties.datetime),
+            fromisoformat(item.properties.datetime)
+        )
+    else:
+        raise StacObjectError(f"Item {item.id} missing datetime or (start_datetime, end_datetime)")
+
+    return (bbox, datetimes)
+
+
+def _get_json_item_bounds(
+    json_object: Dict[str, Any]
+) -> Tuple[Tuple[float, float, float, float], Tuple[datetime.datetime, datetime.datetime]]:
+    """Retrieves a serialized item bbox and datetimes, without validating (nor even looking at) the rest of the item.
+
+    Raises:
+        StacObjectError: If the item geospatial properties are not valid
+    """
+    bbox: Tuple[float, float, float, float]
+    datetimes: Tuple[datetime.datetime, datetime.datetime]
+
+    try:
+        properties = json_object["properties"]
+
+        if json_object.get("bbox") is not None:
+            if len(json_object["bbox"]) != 4:
+                raise NotImplementedError(f"3-dimensional bbox encountered on item {json_object.get('id')}")
+
+            (west, south, east, north) = json_object["bbox"]
+            bbox = (float(west), float(south), float(east), float(north))
+        elif json_object.get("geometry") is not None:
+            bbox = shapely.geometry.shape(json_object["geometry"]).bounds
+        else:
+            raise StacObjectError(f"Item {json_object.get('id')} missing geometry or bbox")
+
+        if properties.get("start_datetime") is not None and properties.get("end_datetime") is not None:
+            datetimes = (
+                fromisoformat(properties["start_datetime"]),
+                fromisoformat(properties["end_datetime"])
+            )
+        elif properties.get("datetime") is not None:
+            datetimes = (
+                fromisoformat(properties["datetime"]),
+                fromisoformat(properties["datetime"])
+            )
+        else:
+            raise StacObjectError(f"Item {json_object.get('id')} missing datetime or (start_datetime, end_datetime)")
+    except StacObjectError as error:
+        raise error
+    except (KeyError, AttributeError, TypeError, ValueError, shapely.errors.ShapelyError) as error:
+        raise StacObjectError(
+            f"Item {json_object.get('id')} geospatial properties are not valid : {str(error)}") from error
+
+    return (bbox, datetimes)
+
+
+def _get_extent_bounds(
+    extent: Extent
+) -> Tuple[List[float], Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]]:
+    """Retrieves an extent overall bbox and datetimes."""
+    return (
+        extent.spatial.bbox[0],
+        (
+            fromisoformat(extent.temporal.interval[0][0]),
+            fromisoformat(extent.temporal.interval[0][1])
+        )
+    )
+
+
 @overload
 def get_extent(
     stac_object: Union[Item, Collection],
@@ -663,31 +958,7 @@ def get_extent(
     """
 
     if isinstance(stac_object, Item):
-        bbox: Tuple[float, float, float, float]
-        datetimes: Tuple[datetime.datetime, datetime.datetime]
-
-        if stac_object.bbox is not None:
-            if len(stac_object.bbox) != 4:
-                raise NotImplementedError(f"3-dimensional bbox encountered on item {stac_object.id}")
-
-            bbox = stac_object.bbox
-        elif stac_object.geometry is not None:
-            bbox = tuple(*shapely.bounds(shapely.geometry.shape(stac_object.geometry)))
-        else:
-            raise StacObjectError(f"Item {stac_object.id} missing geometry or bbox")
-
-        if stac_object.properties.start_datetime is not None and stac_object.properties.end_datetime is not None:
-            datetimes = (
-                fromisoformat(stac_object.properties.start_datetime),
-                fromisoformat(stac_object.properties.end_datetime)
-            )
-        elif stac_object.properties.datetime is not None:
-            datetimes = (
-                fromisoformat(stac_object.properties.datetime),
-                fromisoformat(stac_object.properties.datetime)
-            )
-        else:
-            raise StacObjectError(f"Item {stac_object.id} missing datetime or (start_datetime, end_datetime)")
+        (bbox, datetimes) = _get_item_bounds(stac_object)
 
         return Extent(
             spatial=SpatialExtent(
@@ -731,6 +1002,8 @@ def compute_extent(
 ) -> Optional[Extent]:
     """Computes a STAC object extent. Returns None without raising on (and only on) empty catalogs.
 
+    Unresolved children are loaded concurrently, `io` must be safe to read from several threads.
+
     Raises:
         StacObjectError: If the object geospatial properties are not valid
     """
@@ -754,36 +1027,75 @@ def compute_extent(
     bboxes = deque()
     datetimess = deque()
 
-    for link in stac_object.links:
-        if link.rel not in ("item", "child"):
-            continue
+    def get_child_bounds(
+        child: Union[Item, Collection, Catalog]
+    ) -> Optional[Tuple[List[float], Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]]]:
+        if isinstance(child, Item):
+            (child_bbox, child_datetimes) = _get_item_bounds(child)
+            return (list(child_bbox), child_datetimes)
 
-        if link.target is None:
-            try:
-                child = load(
-                    link.href,
-                    io=io,
-                )
-            except (FileNotFoundError, StacObjectError, HrefError) as error:
-                logger.exception(
-                    f"[{type(error).__name__}] Ignored child {link.href} while computing extent : {str(error)}")
-                continue
+        if isinstance(child, Collection):
+            child_extent = child.extent
         else:
-            child = link.target
-
-        child_extent = get_extent(child, io=io)
+            child_extent = get_extent(child, io=io)
 
         if child_extent is None:
-            continue
+            return None
 
-        is_empty = False
+        return _get_extent_bounds(child_extent)
 
-        child_bbox = child_extent.spatial.bbox[0]
+    def load_child_bounds(
+        href: str
+    ) -> Optional[Tuple[List[float], Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]]]:
+        try:
+            json_object = io.get(href)
 
-        child_datetimes = (
-            fromisoformat(child_extent.temporal.interval[0][0]),
-            fromisoformat(child_extent.temporal.interval[0][1])
-        )
+            json_object_type = json_object.get("type") if isinstance(json_object, dict) else None
+
+            if json_object_type == "Feature":
+                (child_bbox, child_datetimes) = _get_json_item_bounds(json_object)
+                return (list(child_bbox), child_datetimes)
+            elif json_object_type == "Collection":
+                try:
+                    return _get_extent_bounds(Extent.model_validate(json_object.get("extent")))
+                except ValidationError as error:
+                    raise StacObjectError(f"{href} doesn't have a valid extent : {str(error)}") from error
+
+            child = load(
+                href,
+                io=io,
+            )
+        except (FileNotFoundError, StacObjectError, HrefError, JSONObjectError) as error:
+            logger.exception(
+                f"[{type(error).__name__}] Ignored child {href} while computing extent : {str(error)}")
+            return None
+
+        return get_child_bounds(child)
+
+    child_links = [link for link in stac_object.links if link.rel in ("item", "child")]
+    unresolved_child_hrefs = [link.href for link in child_links if link.target is None]
+
+    loaded_children_bounds: List[Optional[Tuple[List[float], Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]]]]
+    if len(unresolved_child_hrefs) > 1:
+        with ThreadPoolExecutor() as executor:
+            loaded_children_bounds = list(executor.map(load_child_bounds, unresolved_child_hrefs))
+    else:
+        loaded_children_bounds = [load_child_bounds(href) for href in unresolved_child_hrefs]
+
+    loaded_children_bounds_iterator = iter(loaded_children_bounds)
+
+    for link in child_links:
+        if link.target is not None:
+            child_bounds = get_child_bounds(link.target)
+        else:
+            child_bounds = next(loaded_children_bounds_iterator)
+
+        if child_bounds is None:
+            continue
+
+        (child_bbox, child_datetimes) = child_bounds
+
+        is_empty = False
 
         bboxes.append(child_bbox)
         datetimess.append(child_datetimes)
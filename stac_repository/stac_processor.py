@@ -1,6 +1,7 @@
 from typing import (
     Iterator,
-    ClassVar
+    ClassVar,
+    Union
 )
 
 import os
@@ -8,10 +9,13 @@ import mimetypes
 import uuid
 import logging
 import posixpath
-from urllib.parse import urlparse
+from functools import lru_cache
 
 
 from .stac import (
+    Item,
+    Collection,
+    Catalog,
     load,
     DefaultReadableStacIO,
     StacIOPerm,
@@ -19,12 +23,38 @@ from .stac import (
     VersionNotFoundError,
     StacObjectError
 )
+from .stac.stac_io import (
+    href_scheme
+)
 
 from .processor import Processor
 
 logger = logging.getLogger(__file__)
 
 
+def _load(product_source: str) -> Union[Item, Collection, Catalog]:
+    if href_scheme(product_source) == "":
+        return _load_file(product_source, os.stat(product_source).st_mtime_ns)
+    else:
+        return _load_source(product_source)
+
+
+@lru_cache(maxsize=64)
+def _load_file(product_file: str, mtime_ns: int) -> Union[Item, Collection, Catalog]:
+    """Discovery, identification and versionning all load the same product file in a row,
+    reuse the parsed object for as long as the file is left unmodified."""
+    return _load_source(product_file)
+
+
+def _load_source(product_source: str) -> Union[Item, Collection, Catalog]:
+    return load(
+        product_source,
+        io=DefaultReadableStacIO({
+            posixpath.abspath(product_source): StacIOPerm.R_STAC
+        })
+    )
+
+
 class StacProcessor(Processor):
 
     __version__: ClassVar[str] = "0.0.1"
@@ -32,19 +62,14 @@ class StacProcessor(Processor):
     @staticmethod
     def discover(source: str) -> Iterator[str]:
         def is_file(file: str) -> bool:
-            return urlparse(file, scheme="").scheme == ""
+            return href_scheme(file) == ""
 
         def is_stac_file(file: str):
             if mimetypes.guess_type(file)[0] != "application/json":
                 return False
 
             try:
-                load(
-                    file,
-                    io=DefaultReadableStacIO({
-                        posixpath.abspath(file): StacIOPerm.R_STAC
-                    })
-                )
+                _load(file)
             except StacObjectError as error:
                 logger.info(f"Skipped {file} : {str(error)}")
                 return False
@@ -58,10 +83,10 @@ class StacProcessor(Processor):
                 return
 
             if os.path.isdir(source):
-                for file_name in os.listdir(source):
-                    file = os.path.join(source, file_name)
-                    if is_stac_file(file):
-                        yield file
+                with os.scandir(source) as entries:
+                    for entry in entries:
+                        if entry.is_file() and is_stac_file(entry.path):
+                            yield entry.path
             else:
                 if is_stac_file(source):
                     yield source
@@ -71,37 +96,25 @@ class StacProcessor(Processor):
 
     @staticmethod
     def id(product_source: str) -> str:
-        if urlparse(product_source, scheme="").scheme == "":
-            product_source = os.path.abspath(product_source)
+        if href_scheme(product_source) == "":
+            product_source = posixpath.abspath(product_source)
 
-        return load(
-            product_source,
-            io=DefaultReadableStacIO({
-                posixpath.abspath(product_source): StacIOPerm.R_STAC
-            })
-        ).id
+        return _load(product_source).id
 
     @staticmethod
     def version(product_source: str) -> str:
-        if urlparse(product_source, scheme="").scheme == "":
-            product_source = os.path.abspath(product_source)
+        if href_scheme(product_source) == "":
+            product_source = posixpath.abspath(product_source)
 
         try:
-            return get_version(
-                load(
-                    product_source,
-                    io=DefaultReadableStacIO({
-                        posixpath.abspath(product_source): StacIOPerm.R_STAC
-                    })
-                )
-            )
+            return get_version(_load(product_source))
         except VersionNotFoundError as error:
             logger.info(f"No version found {product_source}, use id as version")
             return StacProcessor.id(product_source)
 
     @staticmethod
     def process(product_source: str) -> str:
-        if urlparse(product_source, scheme="").scheme == "":
-            product_source = os.path.abspath(product_source)
+        if href_scheme(product_source) == "":
+            product_source = posixpath.abspath(product_source)
 
         return product_source
@@ -12,7 +12,8 @@ from pydantic import (
     BaseModel,
     ValidationError,
     model_validator,
-    ConfigDict
+    ConfigDict,
+    PrivateAttr
 )
 
 from tomlkit import (
@@ -35,6 +36,8 @@ class RepositoryConfig(BaseModel):
         extra="allow",
     )
 
+    _backend_config: Optional[BaseModel] = PrivateAttr(default=None)
+
     def get_backend(self):
         backend = discovered_backends.get(self.backend, None)
 
@@ -44,19 +47,17 @@ class RepositoryConfig(BaseModel):
             return backend
 
     def get_backend_config(self):
+        return self._backend_config
+
+    @model_validator(mode="after")
+    def validate_backend_config(self):
         backend = self.get_backend()
 
         if backend.StacRepository.StacConfig is None:
             if self.model_extra != {}:
                 raise ValueError(f"Options {join_str(self.model_extra.keys())} not supported")
-            else:
-                return None
         else:
-            return backend.StacRepository.StacConfig.model_validate(self.model_extra)
-
-    @model_validator(mode="after")
-    def validate_backend_config(self):
-        self.get_backend_config()
+            self._backend_config = backend.StacRepository.StacConfig.model_validate(self.model_extra)
 
         return self
 
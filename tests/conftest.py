@@ -21,12 +21,21 @@ from stac_repository.git.git import Signature as GitSignature
 from stac_repository.git.git import Commit as GitCommit
 
 
+@pytest.fixture(scope="session")
+def root_dir():
+    temp_dir = tempfile.mkdtemp(prefix="stac-repository-tests-")
+
+    yield temp_dir
+
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 @pytest.fixture
-def make_dir():
+def make_dir(root_dir):
     temp_dirs = []
 
     def _make_dir():
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.mkdtemp(dir=root_dir)
         temp_dirs.append(temp_dir)
         return temp_dir
 
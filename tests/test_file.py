@@ -0,0 +1,203 @@
+import os
+import io
+import json
+import socket
+
+import pytest
+
+from stac_repository.file import StacRepository as FileStacRepository
+from stac_repository.file.file_stac_repository import FileStacConfig
+from stac_repository.file.file_stac_transaction import FileStacTransaction
+
+
+def _write_json(file: str, value: dict):
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+
+    with open(file, "w") as stream:
+        json.dump(value, stream)
+
+
+class _SocketStream(io.RawIOBase):
+    """A non-seekable stream over a socket which, like an HTTP response body, has a file descriptor and reports
+    an offset."""
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._sock.recv_into(buffer)
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def tell(self) -> int:
+        return 0
+
+
+@pytest.fixture
+def products_dir(make_dir):
+    products_dir = make_dir()
+
+    _write_json(os.path.join(products_dir, "root", "catalog.json"), {
+        "type": "Catalog",
+        "stac_version": "1.0.0",
+        "id": "root",
+        "description": "root",
+        "links": []
+    })
+
+    for n in range(2):
+        _write_json(os.path.join(products_dir, f"item{n}", f"item{n}.json"), {
+            "type": "Feature",
+            "stac_version": "1.0.0",
+            "id": f"item{n}",
+            "geometry": {"type": "Point", "coordinates": [n, n]},
+            "bbox": [n, n, n, n],
+            "properties": {"datetime": "2020-01-01T00:00:00Z"},
+            "links": [],
+            "assets": {}
+        })
+
+    return products_dir
+
+
+class TestFileStacRepository():
+
+    def test_search_sees_other_repository_writes(self, dir, products_dir):
+        repository = FileStacRepository(FileStacConfig(path=dir))
+        other_repository = FileStacRepository(FileStacConfig(path=dir))
+
+        list(repository.ingest(os.path.join(products_dir, "root", "catalog.json")))
+        list(repository.ingest(os.path.join(products_dir, "item0", "item0.json"), parent_id="root"))
+        list(other_repository.ingest(os.path.join(products_dir, "item1", "item1.json"), parent_id="root"))
+
+        reports = list(repository.ingest(os.path.join(products_dir, "item1", "item1.json"), parent_id="root"))
+
+        assert any("already cataloged" in str(report.details) for report in reports)
+
+        with open(os.path.join(dir, "catalog.json")) as stream:
+            root = json.load(stream)
+
+        item_links = [link["href"] for link in root["links"] if link["rel"] in ("item", "child")]
+
+        assert len(item_links) == 2
+
+    def test_search_after_abort(self, dir, products_dir):
+        repository = FileStacRepository(FileStacConfig(path=dir))
+
+        list(repository.ingest(os.path.join(products_dir, "root", "catalog.json")))
+        list(repository.ingest(os.path.join(products_dir, "item0", "item0.json"), parent_id="root"))
+
+        transaction = FileStacTransaction(repository)
+
+        assert transaction.search("item0") is not None
+
+        transaction.uncatalog("item0")
+
+        assert transaction.search("item0") is None
+
+        transaction.abort()
+
+        transaction = FileStacTransaction(repository)
+
+        assert transaction.search("item0") is not None
+
+        transaction.abort()
+
+    def test_search_across_transactions(self, dir, products_dir):
+        repository = FileStacRepository(FileStacConfig(path=dir))
+
+        list(repository.ingest(os.path.join(products_dir, "root", "catalog.json")))
+
+        with FileStacTransaction(repository).context() as transaction:
+            assert transaction.search("item0") is None
+
+            transaction.catalog(
+                os.path.join(products_dir, "item0", "item0.json"),
+                parent_id="root",
+                version="1"
+            )
+
+        with FileStacTransaction(repository).context() as transaction:
+            assert transaction.search("item0") is not None
+
+            transaction.uncatalog("item0")
+
+        with FileStacTransaction(repository).context() as transaction:
+            assert transaction.search("item0") is None
+
+    def test_set_asset_from_socket(self, dir):
+        (writer, reader) = socket.socketpair()
+
+        with writer:
+            writer.sendall(b"asset" * 1000)
+
+        transaction = FileStacTransaction(FileStacRepository(FileStacConfig(path=dir)))
+
+        with reader, io.BufferedReader(_SocketStream(reader)) as asset_stream:
+            transaction.set_asset("/asset.bin", asset_stream)
+
+        transaction.commit()
+
+        with open(os.path.join(dir, "asset.bin"), "rb") as asset_stream:
+            assert asset_stream.read() == b"asset" * 1000
+
+    def test_set_asset_advises_regular_files_only(self, dir, file, monkeypatch):
+        advised_fds = []
+
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, advice: advised_fds.append(fd), raising=False)
+
+        (writer, reader) = socket.socketpair()
+
+        with writer:
+            writer.sendall(b"asset")
+
+        transaction = FileStacTransaction(FileStacRepository(FileStacConfig(path=dir)))
+
+        with reader, io.BufferedReader(_SocketStream(reader)) as asset_stream:
+            transaction.set_asset("/socket.bin", asset_stream)
+
+        assert advised_fds == []
+
+        with open(file, "rb") as asset_stream:
+            transaction.set_asset("/file.bin", asset_stream)
+
+            assert asset_stream.fileno() in advised_fds
+
+        transaction.commit()
+
+    @pytest.mark.parametrize("ingest_assets", [True, False])
+    def test_ingest_assets(self, dir, products_dir, ingest_assets):
+        repository = FileStacRepository(FileStacConfig(path=dir))
+
+        item_file = os.path.join(products_dir, "item0", "item0.json")
+
+        with open(item_file) as stream:
+            item = json.load(stream)
+
+        item["assets"] = {"data": {"href": "./item0.bin", "type": "application/octet-stream"}}
+        _write_json(item_file, item)
+
+        with open(os.path.join(products_dir, "item0", "item0.bin"), "wb") as stream:
+            stream.write(b"asset")
+
+        list(repository.ingest(os.path.join(products_dir, "root", "catalog.json")))
+        list(repository.ingest(item_file, parent_id="root", ingest_assets=ingest_assets))
+
+        cataloged_asset_files = [
+            os.path.join(asset_dir, file_name)
+            for (asset_dir, _, file_names) in os.walk(dir)
+            for file_name in file_names
+            if file_name == "item0.bin"
+        ]
+
+        if ingest_assets:
+            assert len(cataloged_asset_files) == 1
+
+            with open(cataloged_asset_files[0], "rb") as stream:
+                assert stream.read() == b"asset"
+        else:
+            assert cataloged_asset_files == []
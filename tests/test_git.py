@@ -88,3 +88,10 @@ class TestCommit():
 
         assert set(commit.modified_files) == set(single_commit_repository.added_files +
                                                  single_commit_repository.removed_files)
+
+    def test_read(self, single_commit_repository: GitCommitDescription):
+        commit = single_commit_repository.repository.head
+
+        for file in single_commit_repository.added_files:
+            with open(file, "rb") as file_stream:
+                assert commit.read(file, text=False) == file_stream.read()
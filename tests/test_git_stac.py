@@ -0,0 +1,159 @@
+from typing import Iterator
+
+import os
+import json
+import tempfile
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stac_repository.base_stac_repository import CommitNotFoundError
+from stac_repository.git.git import Repository as GitRepository
+from stac_repository.git.git2 import _cat_files
+from stac_repository.git.git_stac_commit import GitStacCommit, _read_object_file
+from stac_repository.stac import Catalog, load
+from stac_repository.git.git_stac_repository import GitStacRepository
+from stac_repository.git.git_stac_config import GitStacConfig
+
+
+def _write_json(file: str, value: dict):
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+
+    with open(file, "w") as stream:
+        json.dump(value, stream)
+
+
+@pytest.fixture
+def remote_repository(empty_repository: GitRepository) -> GitRepository:
+    for n_commit in range(3):
+        files = [os.path.join(empty_repository.dir, "catalog.json")]
+
+        _write_json(files[0], {
+            "type": "Catalog",
+            "stac_version": "1.0.0",
+            "id": "root",
+            "description": f"Commit {n_commit}",
+            "links": [
+                {"rel": "item", "href": f"./items/item{n}.json"}
+                for n in range(16)
+            ]
+        })
+
+        for n in range(16):
+            files.append(os.path.join(empty_repository.dir, "items", f"item{n}.json"))
+
+            _write_json(files[-1], {
+                "type": "Feature",
+                "stac_version": "1.0.0",
+                "id": f"item{n}",
+                "geometry": {"type": "Point", "coordinates": [n, n_commit]},
+                "bbox": [n, n_commit, n, n_commit],
+                "properties": {"datetime": "2020-01-01T00:00:00Z"},
+                "links": [],
+                "assets": {}
+            })
+
+        empty_repository.add(*files)
+        empty_repository.commit(f"Commit {n_commit}")
+
+    return empty_repository
+
+
+@pytest.fixture
+def repository(remote_repository: GitRepository, make_dir, monkeypatch) -> Iterator[GitStacRepository]:
+    monkeypatch.setattr(tempfile, "tempdir", make_dir())
+
+    with GitStacRepository(GitStacConfig(repository=remote_repository.dir, use_lfs="http://localhost/lfs")) as repository:
+        yield repository
+
+
+class TestGitStacRepository():
+
+    def test_get_commit_by_short_prefix(self, repository: GitStacRepository):
+        ids = [commit.id for commit in repository.commits]
+
+        for id in ids:
+            for prefix in (id[:1], id[:2], id[:3], id[:7]):
+                if [other_id for other_id in ids if other_id.startswith(prefix)] == [id]:
+                    assert repository.get_commit(prefix).id == id
+                else:
+                    with pytest.raises(CommitNotFoundError):
+                        repository.get_commit(prefix)
+
+    def test_get_commit_rejects_rev_expressions(self, repository: GitStacRepository):
+        with pytest.raises(CommitNotFoundError):
+            repository.get_commit("HEAD")
+
+    def test_close(self, repository: GitStacRepository):
+        repository.get_commit(0).get("/catalog.json")
+
+        repository_dir = repository._local_repository._repository_dir
+
+        assert (repository_dir, False) in _cat_files
+        assert (repository_dir, True) in _cat_files
+
+        assert _read_object_file.cache_info().currsize > 0
+
+        repository.close()
+
+        assert (repository_dir, False) not in _cat_files
+        assert (repository_dir, True) not in _cat_files
+        assert _read_object_file.cache_info().currsize == 0
+
+    def test_commits(self, repository: GitStacRepository):
+        commits = list(repository.commits)
+
+        assert [commit.message for commit in commits] == ["Commit 2", "Commit 1", "Commit 0"]
+        assert [commit.id for commit in commits[1:]] == [commit.parent.id for commit in commits[:-1]]
+        assert commits[-1].parent is None
+
+    def test_get_commit(self, repository: GitStacRepository):
+        commits = list(repository.commits)
+
+        for (i, commit) in enumerate(commits):
+            assert repository.get_commit(commit.id).id == commit.id
+            assert repository.get_commit(commit.id[:8]).id == commit.id
+            assert repository.get_commit(-i).id == commit.id
+
+        with pytest.raises(CommitNotFoundError):
+            repository.get_commit(-len(commits))
+
+        assert repository.get_commit(datetime.datetime.now(datetime.timezone.utc)).id == commits[0].id
+
+        with pytest.raises(CommitNotFoundError):
+            repository.get_commit(commits[-1].datetime - datetime.timedelta(seconds=1))
+
+    def test_get_many(self, repository: GitStacRepository):
+        GitStacCommit.clear_cache()
+
+        hrefs = [f"/items/item{n}.json" for n in range(16)] + ["/catalog.json", "/items/missing.json"]
+
+        for (n_commit, commit) in enumerate(reversed(list(repository.commits))):
+            json_objects = commit.get_many(hrefs)
+
+            assert [json_object["bbox"][1] for json_object in json_objects[:16]] == [n_commit] * 16
+            assert json_objects[16]["description"] == f"Commit {n_commit}"
+            assert isinstance(json_objects[17], FileNotFoundError)
+
+    def test_concurrent_get_many(self, repository: GitStacRepository):
+        GitStacCommit.clear_cache()
+
+        commits = list(repository.commits)
+        hrefs = [f"/items/item{n}.json" for n in range(16)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda commit: commit.get_many(hrefs), commits * 4))
+
+        for (commit, json_objects) in zip(commits * 4, results):
+            assert json_objects == [commit.get(href) for href in hrefs]
+
+    def test_load(self, repository: GitStacRepository):
+        GitStacCommit.clear_cache()
+
+        catalog = load("/catalog.json", resolve_descendants=True, io=repository.get_commit(0))
+
+        assert isinstance(catalog, Catalog)
+        assert sorted(link.target.id for link in catalog.links if link.rel == "item") == sorted(
+            f"item{n}" for n in range(16)
+        )
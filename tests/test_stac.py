@@ -0,0 +1,38 @@
+import os
+import json
+
+import pytest
+
+from stac_repository.stac import (
+    DefaultReadableStacIO,
+    StacIOPerm,
+    StacObjectError,
+    load
+)
+
+
+def _write_catalog(file: str, id: str, child_href: str):
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+
+    with open(file, "w") as stream:
+        json.dump({
+            "type": "Catalog",
+            "stac_version": "1.0.0",
+            "id": id,
+            "description": id,
+            "links": [{"rel": "child", "href": child_href}]
+        }, stream)
+
+
+class TestLoad():
+
+    def test_cyclic_links(self, dir):
+        _write_catalog(os.path.join(dir, "catalog.json"), "root", "./child/catalog.json")
+        _write_catalog(os.path.join(dir, "child", "catalog.json"), "child", "../catalog.json")
+
+        with pytest.raises(StacObjectError):
+            load(
+                os.path.join(dir, "catalog.json"),
+                resolve_descendants=True,
+                io=DefaultReadableStacIO({dir: StacIOPerm.R_STAC})
+            )